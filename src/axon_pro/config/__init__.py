@@ -1,11 +1,17 @@
 """Axon configuration — ignore patterns and language detection."""
 
-from axon_pro.config.ignore import DEFAULT_IGNORE_PATTERNS, load_gitignore, should_ignore
+from axon_pro.config.ignore import (
+    DEFAULT_IGNORE_PATTERNS,
+    dir_is_ignored,
+    load_gitignore,
+    should_ignore,
+)
 from axon_pro.config.languages import SUPPORTED_EXTENSIONS, get_language, is_supported
 
 __all__ = [
     "DEFAULT_IGNORE_PATTERNS",
     "SUPPORTED_EXTENSIONS",
+    "dir_is_ignored",
     "get_language",
     "is_supported",
     "load_gitignore",
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-import fnmatch
+import functools
+import os
+import re
+from collections.abc import Callable
 from pathlib import Path
 
+import pathspec
+
 DEFAULT_IGNORE_PATTERNS: frozenset[str] = frozenset(
     {
         # Directories
@@ -46,51 +51,156 @@ DEFAULT_IGNORE_PATTERNS: frozenset[str] = frozenset(
 )
 
 # Separate glob patterns (contain wildcards) from literal names at module load
-# so we only compute this once.
-_GLOB_PATTERNS: frozenset[str] = frozenset(p for p in DEFAULT_IGNORE_PATTERNS if "*" in p or "?" in p)
-_LITERAL_PATTERNS: frozenset[str] = DEFAULT_IGNORE_PATTERNS - _GLOB_PATTERNS
-
-def _matches_default_patterns(path: Path) -> bool:
-    """Check whether *path* (relative) matches any default ignore pattern."""
-    for part in path.parts:
-        if part in _LITERAL_PATTERNS:
-            return True
-        # Also check globs against every component (e.g. *.pyc as a directory — unlikely but consistent)
-        for pattern in _GLOB_PATTERNS:
-            if fnmatch.fnmatch(part, pattern):
-                return True
-    return False
+# so we only compute this once.  Literals are checked with a set-disjointness
+# test over the path segments; the remaining globs go through pathspec.
+_GLOB_IGNORES: tuple[str, ...] = tuple(
+    sorted(p for p in DEFAULT_IGNORE_PATTERNS if any(c in p for c in "*?["))
+)
+_LITERAL_IGNORES: frozenset[str] = DEFAULT_IGNORE_PATTERNS - frozenset(_GLOB_IGNORES)
+
+# Pure extension globs (``*.pyc``, ``*.min.js``) need no regex: ``str.endswith``
+# accepts a tuple and checks every suffix in C.
+_SUFFIX_IGNORES: tuple[str, ...] = tuple(
+    p[1:]
+    for p in _GLOB_IGNORES
+    if p.startswith("*.") and p.count("*") == 1 and "?" not in p and "[" not in p
+)
 
-_pathspec_cache: dict[tuple[str, ...], object] = {}
+# Default globs not covered by the fast paths above.  Under gitignore rules a
+# slash-free pattern matches any path component, which is the semantics the
+# default patterns have always had.
+_SPEC_IGNORES: tuple[str, ...] = tuple(p for p in _GLOB_IGNORES if p[1:] not in _SUFFIX_IGNORES)
 
-def _matches_gitignore(path: Path, gitignore_patterns: list[str]) -> bool:
-    """Check *path* against a list of gitignore-style patterns.
+def _union_matcher(spec: pathspec.PathSpec) -> Callable[[str], bool]:
+    """Fold the compiled regexes of *spec* into a single pre-compiled pattern.
 
-    Uses ``pathspec`` when available for full gitignore semantics; falls back to
-    fnmatch per-pattern otherwise.  The compiled pathspec is cached by the
-    pattern content so it is only built once per unique pattern set.
+    ``PathSpec.match_file`` tries each pattern's regex in turn, so its cost
+    grows with the pattern count.  Without negated (``!``) patterns the spec
+    ignores a path iff *any* pattern matches, which one alternation regex
+    answers with a single ``match`` call.  Specs with negations, named
+    groups, or unusual regex flags keep ``match_file`` for exact semantics.
     """
-    if not gitignore_patterns:
-        return False
+    patterns = [p for p in spec.patterns if p.include is not None]
+    regexes = [p.regex for p in patterns]
+    if any(
+        not p.include or r.groupindex or r.flags != re.UNICODE
+        for p, r in zip(patterns, regexes)
+    ):
+        return spec.match_file
+    union = re.compile("|".join(f"(?:{r.pattern})" for r in regexes))
+    return lambda path: union.match(path) is not None
 
-    try:
-        import pathspec
-
-        cache_key = tuple(gitignore_patterns)
-        spec = _pathspec_cache.get(cache_key)
-        if spec is None:
-            spec = pathspec.PathSpec.from_lines("gitignore", gitignore_patterns)
-            _pathspec_cache[cache_key] = spec
-        return spec.match_file(str(path))  # type: ignore[union-attr]
-    except ImportError:  # pragma: no cover — pathspec is a declared dependency
-        path_str = str(path)
-        for pattern in gitignore_patterns:
-            if fnmatch.fnmatch(path_str, pattern):
-                return True
-            if fnmatch.fnmatch(path.name, pattern):
+class _IgnoreTrie:
+    """Prefix trie over gitignore patterns made only of literal segments.
+
+    Anchored patterns (``/build``, ``docs/api/``) are stored along their
+    segments from the repository root; slash-free patterns (``tmp/``,
+    ``secrets``) may match at any depth and live in a flat ``floating`` map.
+    A path is tested by walking its segments once, so the cost grows with
+    path depth rather than with the number of patterns.
+
+    Each terminal records whether the pattern had a trailing slash: such
+    patterns only match directories, i.e. a segment with more path after it.
+    """
+
+    __slots__ = ("children", "terminal", "floating")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _IgnoreTrie] = {}
+        # None: no pattern ends here; True: directory-only; False: any entry.
+        self.terminal: bool | None = None
+        self.floating: dict[str, bool] = {}
+
+    @classmethod
+    def from_patterns(
+        cls, patterns: tuple[str, ...]
+    ) -> tuple[_IgnoreTrie | None, tuple[str, ...]]:
+        """Split *patterns* into a trie and the patterns it cannot represent.
+
+        Patterns containing glob or escape characters (including ``**``)
+        are returned untouched for regex matching.  The trie is ``None``
+        when no pattern was literal.
+        """
+        trie = cls()
+        rest: list[str] = []
+        for pattern in patterns:
+            dir_only = pattern.endswith("/")
+            body = pattern.strip("/")
+            if not body or any(c in pattern for c in "*?[\\!#") or "//" in body:
+                rest.append(pattern)
+                continue
+            if "/" not in pattern.rstrip("/"):
+                # A later non-directory pattern widens an earlier one.
+                trie.floating[body] = trie.floating.get(body, True) and dir_only
+                continue
+            node = trie
+            for segment in body.split("/"):
+                node = node.children.setdefault(segment, cls())
+            node.terminal = dir_only if node.terminal is None else node.terminal and dir_only
+        if not trie.children and not trie.floating:
+            return None, tuple(rest)
+        return trie, tuple(rest)
+
+    def matches(self, path: str) -> bool:
+        """Return ``True`` if any stored pattern matches the posix *path*."""
+        segments = path.split("/")
+        last = len(segments) - 1
+        floating = self.floating
+        # The C-level disjointness test rejects most paths before any loop.
+        if not floating.keys().isdisjoint(segments):
+            for i, segment in enumerate(segments):
+                dir_only = floating.get(segment)
+                if dir_only is not None and (i < last or not dir_only):
+                    return True
+        if segments[0] not in self.children:
+            return False
+        node: _IgnoreTrie | None = self
+        for i, segment in enumerate(segments):
+            node = node.children.get(segment)
+            if node is None:
+                return False
+            if node.terminal is not None and (i < last or not node.terminal):
                 return True
         return False
 
+@functools.lru_cache(maxsize=32)
+def _split_patterns(
+    extra_patterns: tuple[str, ...],
+) -> tuple[_IgnoreTrie | None, tuple[str, ...]]:
+    """Return the literal-pattern trie and residual patterns for *extra_patterns*.
+
+    Negated patterns depend on their order relative to every other pattern,
+    so when any is present no trie is built and all patterns are residual.
+    """
+    if any(p.startswith("!") for p in extra_patterns):
+        return None, extra_patterns
+    return _IgnoreTrie.from_patterns(extra_patterns)
+
+@functools.lru_cache(maxsize=32)
+def _compiled_spec(extra_patterns: tuple[str, ...]) -> Callable[[str], bool] | None:
+    """Return a matcher for the default globs plus *extra_patterns*.
+
+    Literal gitignore patterns are answered by an :class:`_IgnoreTrie`; the
+    rest are parsed with ``pathspec`` for gitignore semantics.  Matchers are
+    built once per unique set of gitignore patterns; returns ``None`` when
+    there is nothing to match.
+    """
+    trie, residual = _split_patterns(extra_patterns)
+    lines = (*_SPEC_IGNORES, *residual)
+    regex = _union_matcher(pathspec.PathSpec.from_lines("gitignore", lines)) if lines else None
+    if trie is None:
+        return regex
+    if regex is None:
+        return trie.matches
+    return lambda path: trie.matches(path) or regex(path)
+
+def _to_posix(path: str | Path) -> str:
+    """Return *path* as a ``/``-separated string without building a ``Path``."""
+    path_str = os.fspath(path)
+    if os.sep != "/":
+        path_str = path_str.replace(os.sep, "/")
+    return path_str
+
 def should_ignore(
     path: str | Path,
     gitignore_patterns: list[str] | None = None,
@@ -104,30 +214,66 @@ def should_ignore(
     gitignore_patterns:
         Optional list of gitignore-style patterns loaded via :func:`load_gitignore`.
     """
-    p = Path(path)
+    path_str = _to_posix(path)
 
-    if _matches_default_patterns(p):
+    # Most walked paths are plain files whose name alone decides the outcome,
+    # so test the basename before looking at the directory part.
+    sep = path_str.rfind("/")
+    name = path_str[sep + 1:]
+    if name in _LITERAL_IGNORES or name.endswith(_SUFFIX_IGNORES):
         return True
 
-    if gitignore_patterns and _matches_gitignore(p, gitignore_patterns):
+    patterns = tuple(gitignore_patterns) if gitignore_patterns else ()
+    if sep > 0 and dir_is_ignored(path_str[:sep], patterns):
         return True
 
-    return False
+    matcher = _compiled_spec(patterns)
+    return matcher is not None and matcher(path_str)
+
+@functools.lru_cache(maxsize=4096)
+def dir_is_ignored(dir_path: str, gitignore_patterns: tuple[str, ...] = ()) -> bool:
+    """Return ``True`` if the directory *dir_path* or any of its ancestors is ignored.
+
+    Results are cached per directory, so every file beneath an ignored
+    directory such as ``node_modules`` is rejected with a single lookup.
+
+    Parameters
+    ----------
+    dir_path:
+        A relative, ``/``-separated directory path without a trailing slash.
+    gitignore_patterns:
+        Gitignore-style patterns as a tuple, so that they can be hashed.
+    """
+    sep = dir_path.rfind("/")
+    segment = dir_path[sep + 1:]
+    # Default extension globs apply to directory names too (``lib.so/x.py``).
+    if segment in _LITERAL_IGNORES or segment.endswith(_SUFFIX_IGNORES):
+        return True
+    if sep > 0 and dir_is_ignored(dir_path[:sep], gitignore_patterns):
+        return True
+
+    # Only literal patterns are consulted here: a trie match on a directory
+    # always implies a match on everything below it, which pathspec's glob
+    # translations (e.g. ``a/*``) do not guarantee.  Globs are left to the
+    # file-level check in should_ignore.
+    trie = _split_patterns(gitignore_patterns)[0] if gitignore_patterns else None
+    return trie is not None and trie.matches(f"{dir_path}/")
 
 def load_gitignore(repo_path: Path) -> list[str]:
     """Read ``.gitignore`` from *repo_path* and return a list of patterns.
 
     Blank lines and comments (lines starting with ``#``) are stripped.
-    Returns an empty list when the file does not exist.
+    Returns an empty list when the file does not exist, including when
+    *repo_path* is itself a file.
     """
-    gitignore = repo_path / ".gitignore"
-    if not gitignore.is_file():
+    # Open directly instead of checking is_file() first: one syscall, not two.
+    try:
+        with (repo_path / ".gitignore").open("rb") as f:
+            # Strip and filter as bytes; only surviving lines are decoded.
+            return [
+                line.decode("utf-8")
+                for line in (raw_line.strip() for raw_line in f)
+                if line and not line.startswith(b"#")
+            ]
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
         return []
-
-    lines: list[str] = []
-    text = gitignore.read_text(encoding="utf-8")
-    for raw_line in text.splitlines():
-        line = raw_line.strip()
-        if line and not line.startswith("#"):
-            lines.append(line)
-    return lines
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 SUPPORTED_EXTENSIONS: dict[str, str] = {
@@ -18,14 +19,37 @@ SUPPORTED_EXTENSIONS: dict[str, str] = {
     ".blade.php": "blade",
 }
 
+# All supported extensions as one tuple so ``str.endswith`` can reject an
+# unsupported path in a single C-level call before any slicing or hashing.
+_EXT_TUPLE: tuple[str, ...] = tuple(SUPPORTED_EXTENSIONS)
+
+# Characters that end a directory segment, matching how ``Path`` splits.
+_SEPARATORS = os.sep + (os.altsep or "")
+
+def _suffix(file_path: str | Path) -> str | None:
+    """Return the final ``.ext`` of *file_path* if it could be supported, else ``None``."""
+    # ``type() is`` skips the MRO walk of ``isinstance``; plain strings are
+    # the hot path and anything else goes through the os.PathLike protocol.
+    path_str = file_path if type(file_path) is str else os.fspath(file_path)
+    if not path_str.endswith(_EXT_TUPLE):
+        return None
+    dot = path_str.rfind(".")
+    # A leading dot names a dotfile (``.py``, ``src/.ts``), not an extension.
+    if dot == 0 or path_str[dot - 1] in _SEPARATORS:
+        return None
+    return path_str[dot:]
+
 def get_language(file_path: str | Path) -> str | None:
     """Return the language name for *file_path* based on its extension.
 
     Returns ``None`` when the extension is not in :data:`SUPPORTED_EXTENSIONS`.
     """
-    suffix = Path(file_path).suffix
+    suffix = _suffix(file_path)
+    if suffix is None:
+        return None
     return SUPPORTED_EXTENSIONS.get(suffix)
 
 def is_supported(file_path: str | Path) -> bool:
     """Return ``True`` if *file_path* has a supported extension."""
-    return Path(file_path).suffix in SUPPORTED_EXTENSIONS
+    suffix = _suffix(file_path)
+    return suffix is not None and suffix in SUPPORTED_EXTENSIONS
@@ -14,7 +14,7 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from axon_pro.core.embeddings.text import build_class_method_index, generate_text
+from axon_pro.core.embeddings.text import generate_text
 from axon_pro.core.graph.graph import KnowledgeGraph
 from axon_pro.core.graph.model import NodeLabel
 from axon_pro.core.storage.base import NodeEmbedding
@@ -52,6 +52,8 @@ def embed_graph(
     Uses fastembed's :class:`TextEmbedding` model for batch encoding.
     Each embeddable node is converted to a natural-language description
     via :func:`generate_text`, then embedded in a single batch call.
+    :func:`generate_text` memoizes per graph, so re-embedding a graph whose
+    :attr:`~KnowledgeGraph.version` has not changed skips text generation.
 
     Args:
         graph: The knowledge graph whose nodes should be embedded.
@@ -61,16 +63,15 @@ def embed_graph(
 
     Returns:
         A list of :class:`NodeEmbedding` instances, one per embeddable node,
-        each carrying the node's ID and its embedding vector as a plain
-        Python ``list[float]``.
+        each carrying the node's ID and the float32 ``numpy`` vector the
+        model produced (no per-element copy into a Python list).
     """
     nodes = [n for n in graph.iter_nodes() if n.label in EMBEDDABLE_LABELS]
 
     if not nodes:
         return []
 
-    class_method_idx = build_class_method_index(graph)
-    texts = [generate_text(node, graph, class_method_idx) for node in nodes]
+    texts = [generate_text(node, graph) for node in nodes]
 
     model = _get_model(model_name)
     vectors = list(model.embed(texts, batch_size=batch_size))
@@ -80,7 +81,7 @@ def embed_graph(
         results.append(
             NodeEmbedding(
                 node_id=node.id,
-                embedding=vector.tolist(),
+                embedding=vector,
             )
         )
 
@@ -8,16 +8,37 @@ references, class members, etc.).
 
 from __future__ import annotations
 
+from operator import attrgetter
+from weakref import WeakKeyDictionary
+
 from axon_pro.core.graph.graph import KnowledgeGraph
 from axon_pro.core.graph.model import GraphNode, NodeLabel, RelType
 
+# Generated texts per graph, tagged with the graph version they were built
+# at.  Any add or remove on the graph bumps its version and drops the texts,
+# since a node's description includes its neighbours' names.
+_text_cache: WeakKeyDictionary[KnowledgeGraph, tuple[int, dict[str, str]]] = (
+    WeakKeyDictionary()
+)
+
+# Name-only class -> method names index per graph version, shared by every
+# class text generated without an explicit class_method_index.
+_method_index_cache: WeakKeyDictionary[
+    KnowledgeGraph, tuple[int, dict[str, list[str]]]
+] = WeakKeyDictionary()
+
+# C-level field readers for the name-list helpers below.
+_name = attrgetter("name")
+_source = attrgetter("source")
+_target = attrgetter("target")
+
 def build_class_method_index(graph: KnowledgeGraph) -> dict[str, list[str]]:
     """Pre-build a mapping from class names to their sorted method names.
 
     Avoids O(classes × methods) scanning when generating text for each class.
     """
     index: dict[str, list[str]] = {}
-    for method in graph.get_nodes_by_label(NodeLabel.METHOD):
+    for method in graph.iter_nodes_by_label(NodeLabel.METHOD):
         if method.class_name:
             index.setdefault(method.class_name, []).append(method.name)
     for names in index.values():
@@ -38,27 +59,53 @@ def generate_text(
     Args:
         node: The graph node to describe.
         graph: The knowledge graph that *node* belongs to.
-        class_method_index: Optional pre-built class→method names index.
-            When provided, avoids O(N) scans for class text generation.
+        class_method_index: Optional pre-built class→method names index
+            from :func:`build_class_method_index`.  When omitted, the same
+            name-only index is built once per graph version.
 
     Returns:
         A multi-line text description of the node.
+
+    Texts for nodes that belong to *graph* are memoized until the graph's
+    :attr:`~KnowledgeGraph.version` changes; calls that pass a
+    *class_method_index* bypass the cache.
     """
+    if class_method_index is not None or graph.get_node(node.id) is not node:
+        return _build_text(node, graph, class_method_index)
+
+    version = graph.version
+    cached = _text_cache.get(graph)
+    if cached is None or cached[0] != version:
+        cached = (version, {})
+        _text_cache[graph] = cached
+    texts = cached[1]
+
+    text = texts.get(node.id)
+    if text is None:
+        text = texts[node.id] = _build_text(node, graph)
+    return text
+
+def _build_text(
+    node: GraphNode,
+    graph: KnowledgeGraph,
+    class_method_index: dict[str, list[str]] | None = None,
+) -> str:
+    """Dispatch to the per-label text builder for *node*."""
     label = node.label
 
     if label in (NodeLabel.FUNCTION, NodeLabel.METHOD):
         return _text_for_callable(node, graph)
-    if label == NodeLabel.CLASS:
+    if label is NodeLabel.CLASS:
         return _text_for_class(node, graph, class_method_index)
-    if label == NodeLabel.FILE:
+    if label is NodeLabel.FILE:
         return _text_for_file(node, graph)
-    if label == NodeLabel.FOLDER:
+    if label is NodeLabel.FOLDER:
         return _text_for_folder(node, graph)
     if label in (NodeLabel.INTERFACE, NodeLabel.TYPE_ALIAS, NodeLabel.ENUM):
         return _text_for_type_definition(node, graph)
-    if label == NodeLabel.COMMUNITY:
+    if label is NodeLabel.COMMUNITY:
         return _text_for_community(node, graph)
-    if label == NodeLabel.PROCESS:
+    if label is NodeLabel.PROCESS:
         return _text_for_process(node, graph)
 
     # Fallback for any unexpected label — still produce something useful.
@@ -71,17 +118,19 @@ def _text_for_callable(node: GraphNode, graph: KnowledgeGraph) -> str:
     if node.signature:
         lines.append(f"signature: {node.signature}")
 
-    callee_names = _target_names(node.id, RelType.CALLS, graph)
+    targets = _target_names_by_type(node.id, graph)
+
+    callee_names = targets.get(RelType.CALLS)
     if callee_names:
-        lines.append(f"calls: {', '.join(callee_names)}")
+        lines.append(f"calls: {', '.join(sorted(callee_names))}")
 
     caller_names = _source_names(node.id, RelType.CALLS, graph)
     if caller_names:
         lines.append(f"called by: {', '.join(caller_names)}")
 
-    type_names = _target_names(node.id, RelType.USES_TYPE, graph)
+    type_names = targets.get(RelType.USES_TYPE)
     if type_names:
-        lines.append(f"uses types: {', '.join(type_names)}")
+        lines.append(f"uses types: {', '.join(sorted(type_names))}")
 
     return "\n".join(lines)
 
@@ -96,17 +145,19 @@ def _text_for_class(
     if class_method_index is not None:
         method_names = class_method_index.get(node.name, [])
     else:
-        method_names = _class_method_names(node.name, graph)
+        method_names = _class_method_names(node, graph)
     if method_names:
         lines.append(f"methods: {', '.join(method_names)}")
 
-    base_names = _target_names(node.id, RelType.EXTENDS, graph)
+    targets = _target_names_by_type(node.id, graph)
+
+    base_names = targets.get(RelType.EXTENDS)
     if base_names:
-        lines.append(f"extends: {', '.join(base_names)}")
+        lines.append(f"extends: {', '.join(sorted(base_names))}")
 
-    iface_names = _target_names(node.id, RelType.IMPLEMENTS, graph)
+    iface_names = targets.get(RelType.IMPLEMENTS)
     if iface_names:
-        lines.append(f"implements: {', '.join(iface_names)}")
+        lines.append(f"implements: {', '.join(sorted(iface_names))}")
 
     return "\n".join(lines)
 
@@ -114,13 +165,15 @@ def _text_for_file(node: GraphNode, graph: KnowledgeGraph) -> str:
     """Build text for FILE nodes."""
     lines: list[str] = [_header(node)]
 
-    defined_names = _target_names(node.id, RelType.DEFINES, graph)
+    targets = _target_names_by_type(node.id, graph)
+
+    defined_names = targets.get(RelType.DEFINES)
     if defined_names:
-        lines.append(f"defines: {', '.join(defined_names)}")
+        lines.append(f"defines: {', '.join(sorted(defined_names))}")
 
-    import_names = _target_names(node.id, RelType.IMPORTS, graph)
+    import_names = targets.get(RelType.IMPORTS)
     if import_names:
-        lines.append(f"imports: {', '.join(import_names)}")
+        lines.append(f"imports: {', '.join(sorted(import_names))}")
 
     return "\n".join(lines)
 
@@ -167,7 +220,7 @@ def _header(node: GraphNode) -> str:
     """Build the opening line: ``<label> <name> in <file_path>``."""
     parts: list[str] = [f"{node.label.value} {node.name}"]
 
-    if node.label == NodeLabel.METHOD and node.class_name:
+    if node.label is NodeLabel.METHOD and node.class_name:
         parts.append(f"of class {node.class_name}")
 
     if node.file_path:
@@ -179,27 +232,45 @@ def _target_names(
     node_id: str, rel_type: RelType, graph: KnowledgeGraph
 ) -> list[str]:
     """Return sorted names of target nodes for outgoing edges of *rel_type*."""
-    rels = graph.get_outgoing(node_id, rel_type=rel_type)
-    names: list[str] = []
-    for rel in rels:
+    rels = graph.iter_outgoing(node_id, rel_type)
+    # filter(None, ...) drops ids whose node is missing from the graph.
+    return sorted(map(_name, filter(None, map(graph.get_node, map(_target, rels)))))
+
+def _target_names_by_type(
+    node_id: str, graph: KnowledgeGraph
+) -> dict[RelType, list[str]]:
+    """Return unsorted target names of *node_id*'s outgoing edges, by edge type.
+
+    One pass over the adjacency list serves every section of a node's text,
+    instead of one filtered :meth:`KnowledgeGraph.iter_outgoing` call each.
+    Edge types with no resolvable target get no entry, so an absent key
+    means the section is skipped without sorting or joining anything.
+    """
+    buckets: dict[RelType, list[str]] = {}
+    for rel in graph.iter_outgoing(node_id):
         target = graph.get_node(rel.target)
         if target is not None:
-            names.append(target.name)
-    return sorted(names)
+            buckets.setdefault(rel.type, []).append(target.name)
+    return buckets
 
 def _source_names(
     node_id: str, rel_type: RelType, graph: KnowledgeGraph
 ) -> list[str]:
     """Return sorted names of source nodes for incoming edges of *rel_type*."""
-    rels = graph.get_incoming(node_id, rel_type=rel_type)
-    names: list[str] = []
-    for rel in rels:
-        source = graph.get_node(rel.source)
-        if source is not None:
-            names.append(source.name)
-    return sorted(names)
-
-def _class_method_names(class_name: str, graph: KnowledgeGraph) -> list[str]:
-    """Return sorted names of METHOD nodes whose ``class_name`` matches."""
-    methods = graph.get_nodes_by_label(NodeLabel.METHOD)
-    return sorted(m.name for m in methods if m.class_name == class_name)
+    rels = graph.iter_incoming(node_id, rel_type)
+    return sorted(map(_name, filter(None, map(graph.get_node, map(_source, rels)))))
+
+def _class_method_names(node: GraphNode, graph: KnowledgeGraph) -> list[str]:
+    """Return sorted names of the METHOD nodes whose ``class_name`` is *node*'s.
+
+    Methods are matched by class name alone, wherever they are defined, so
+    the parts of a split class (e.g. C# partial classes) are listed
+    together.  This is the same result :func:`build_class_method_index`
+    gives, served from one index per graph version.
+    """
+    version = graph.version
+    cached = _method_index_cache.get(graph)
+    if cached is None or cached[0] != version:
+        cached = (version, build_class_method_index(graph))
+        _method_index_cache[graph] = cached
+    return cached[1].get(node.name, [])
@@ -2,14 +2,16 @@
 
 Provides a lightweight, dict-backed graph that stores :class:`GraphNode` and
 :class:`GraphRelationship` instances with O(1) lookups by ID.  Secondary
-indexes on label, relationship type, and adjacency lists ensure that queries
-scale linearly with the *result* set rather than the total graph size.
+indexes on label, file path, relationship type, and adjacency lists ensure
+that queries scale linearly with the *result* set rather than the total graph
+size.
 """
 
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, KeysView
+from contextlib import contextmanager
 
 from axon_pro.core.graph.model import GraphNode, GraphRelationship, NodeLabel, RelType
 
@@ -30,10 +32,41 @@ class KnowledgeGraph:
 
         # Secondary indexes — kept in sync by add/remove helpers.
         self._by_label: dict[NodeLabel, dict[str, GraphNode]] = defaultdict(dict)
+        self._by_file: dict[str, dict[str, GraphNode]] = defaultdict(dict)
+        # METHOD nodes keyed by (file_path, class_name).
+        self._methods_by_class: dict[tuple[str, str], dict[str, GraphNode]] = defaultdict(dict)
         self._by_rel_type: dict[RelType, dict[str, GraphRelationship]] = defaultdict(dict)
         self._outgoing: dict[str, dict[str, GraphRelationship]] = defaultdict(dict)
         self._incoming: dict[str, dict[str, GraphRelationship]] = defaultdict(dict)
 
+        # Insert buffers; only non-None inside a bulk_insert() block.
+        self._pending_nodes: list[GraphNode] | None = None
+        self._pending_rels: list[GraphRelationship] | None = None
+
+        # Bumped by every mutating method; see the ``version`` property.
+        self._version = 0
+
+    def reset(self) -> None:
+        """Remove every node and relationship, keeping the index containers.
+
+        Items buffered by an open :meth:`bulk_insert` block are dropped too.
+
+        The version keeps counting upward, so anything memoized against an
+        earlier reading is invalidated rather than matched by accident.
+        """
+        self._nodes.clear()
+        self._relationships.clear()
+        self._by_label.clear()
+        self._by_file.clear()
+        self._methods_by_class.clear()
+        self._by_rel_type.clear()
+        self._outgoing.clear()
+        self._incoming.clear()
+        for pending in (self._pending_nodes, self._pending_rels):
+            if pending is not None:
+                pending.clear()
+        self._version += 1
+
     def iter_nodes(self) -> Iterator[GraphNode]:
         """Yield all nodes without creating an intermediate list."""
         return iter(self._nodes.values())
@@ -42,6 +75,24 @@ class KnowledgeGraph:
         """Yield all relationships without creating an intermediate list."""
         return iter(self._relationships.values())
 
+    def node_ids(self) -> KeysView[str]:
+        """Return a live view of every node id, without copying."""
+        return self._nodes.keys()
+
+    def relationship_ids(self) -> KeysView[str]:
+        """Return a live view of every relationship id, without copying."""
+        return self._relationships.keys()
+
+    @property
+    def version(self) -> int:
+        """Return a counter that changes whenever the graph is mutated.
+
+        Two equal readings mean no node or relationship was added or removed
+        in between, so derived data (such as embedding texts) can be reused.
+        In-place edits to node or relationship objects are not tracked.
+        """
+        return self._version
+
     @property
     def node_count(self) -> int:
         """Return the number of nodes without list materialization."""
@@ -56,21 +107,89 @@ class KnowledgeGraph:
         """Return the count of nodes with *label* without list materialization."""
         return len(self._by_label.get(label, {}))
 
+    def count_relationships_by_type(self, rel_type: RelType) -> int:
+        """Return the count of relationships of *rel_type* without list materialization."""
+        return len(self._by_rel_type.get(rel_type, {}))
+
     def has_incoming(self, node_id: str, rel_type: RelType) -> bool:
         """Return ``True`` if *node_id* has any incoming edge of *rel_type*.
 
         Checks the index without materializing a list of relationships.
         """
         rels = self._incoming.get(node_id, {})
-        return any(r.type == rel_type for r in rels.values())
+        return any(r.type is rel_type for r in rels.values())
 
     def add_node(self, node: GraphNode) -> None:
         """Add *node* to the graph, replacing any existing node with the same id."""
+        if self._pending_nodes is not None:
+            self._pending_nodes.append(node)
+            return
         old = self._nodes.get(node.id)
-        if old is not None and old.label != node.label:
-            self._by_label[old.label].pop(node.id, None)
+        if old is not None:
+            if old.label is not node.label:
+                self._by_label[old.label].pop(node.id, None)
+            if old.file_path != node.file_path:
+                self._by_file[old.file_path].pop(node.id, None)
+            if old.label is NodeLabel.METHOD and old.class_name:
+                self._methods_by_class[(old.file_path, old.class_name)].pop(node.id, None)
         self._nodes[node.id] = node
         self._by_label[node.label][node.id] = node
+        self._by_file[node.file_path][node.id] = node
+        if node.label is NodeLabel.METHOD and node.class_name:
+            self._methods_by_class[(node.file_path, node.class_name)][node.id] = node
+        self._version += 1
+
+    def add_nodes(self, nodes: Iterable[GraphNode]) -> None:
+        """Add every node in *nodes*, with the same semantics as :meth:`add_node`.
+
+        Index lookups are bound once for the whole batch instead of per node.
+        """
+        if self._pending_nodes is not None:
+            self._pending_nodes.extend(nodes)
+            return
+        all_nodes = self._nodes
+        by_label = self._by_label
+        by_file = self._by_file
+        methods_by_class = self._methods_by_class
+        method = NodeLabel.METHOD
+        for node in nodes:
+            old = all_nodes.get(node.id)
+            if old is not None:
+                if old.label is not node.label:
+                    by_label[old.label].pop(node.id, None)
+                if old.file_path != node.file_path:
+                    by_file[old.file_path].pop(node.id, None)
+                if old.label is method and old.class_name:
+                    methods_by_class[(old.file_path, old.class_name)].pop(node.id, None)
+            all_nodes[node.id] = node
+            by_label[node.label][node.id] = node
+            by_file[node.file_path][node.id] = node
+            if node.label is method and node.class_name:
+                methods_by_class[(node.file_path, node.class_name)][node.id] = node
+        self._version += 1
+
+    @contextmanager
+    def bulk_insert(self) -> Iterator[None]:
+        """Buffer :meth:`add_node` and :meth:`add_relationship` calls until exit.
+
+        Buffered items are not visible to queries inside the block; on a
+        normal exit all nodes, then all relationships, are indexed in one
+        batch each.  If the block raises, the buffered items are discarded.
+        Nested blocks join the outermost one.
+        """
+        if self._pending_nodes is not None:
+            yield
+            return
+
+        nodes: list[GraphNode] = []
+        rels: list[GraphRelationship] = []
+        self._pending_nodes, self._pending_rels = nodes, rels
+        try:
+            yield
+        finally:
+            self._pending_nodes = self._pending_rels = None
+        self.add_nodes(nodes)
+        self.add_relationships(rels)
 
     def get_node(self, node_id: str) -> GraphNode | None:
         """Return the node with *node_id*, or ``None`` if it does not exist."""
@@ -87,7 +206,11 @@ class KnowledgeGraph:
             return False
 
         self._by_label[node.label].pop(node_id, None)
+        self._by_file[node.file_path].pop(node_id, None)
+        if node.label is NodeLabel.METHOD and node.class_name:
+            self._methods_by_class[(node.file_path, node.class_name)].pop(node_id, None)
         self._cascade_relationships_for_node(node_id)
+        self._version += 1
         return True
 
     def remove_nodes_by_file(self, file_path: str) -> int:
@@ -96,22 +219,26 @@ class KnowledgeGraph:
         Returns:
             The number of nodes removed.
         """
-        ids_to_remove = [
-            nid for nid, node in self._nodes.items() if node.file_path == file_path
-        ]
-        if not ids_to_remove:
+        nodes = self._by_file.pop(file_path, None)
+        if not nodes:
             return 0
 
-        for nid in ids_to_remove:
-            node = self._nodes.pop(nid)
+        for nid, node in nodes.items():
+            del self._nodes[nid]
             self._by_label[node.label].pop(nid, None)
+            if node.label is NodeLabel.METHOD and node.class_name:
+                self._methods_by_class.pop((file_path, node.class_name), None)
 
-        for nid in ids_to_remove:
+        for nid in nodes:
             self._cascade_relationships_for_node(nid)
-        return len(ids_to_remove)
+        self._version += 1
+        return len(nodes)
 
     def add_relationship(self, rel: GraphRelationship) -> None:
         """Add *rel* to the graph, replacing any existing relationship with the same id."""
+        if self._pending_rels is not None:
+            self._pending_rels.append(rel)
+            return
         old = self._relationships.get(rel.id)
         if old is not None:
             self._by_rel_type[old.type].pop(rel.id, None)
@@ -121,15 +248,58 @@ class KnowledgeGraph:
         self._by_rel_type[rel.type][rel.id] = rel
         self._outgoing[rel.source][rel.id] = rel
         self._incoming[rel.target][rel.id] = rel
+        self._version += 1
+
+    def add_relationships(self, rels: Iterable[GraphRelationship]) -> None:
+        """Add every relationship in *rels*, as :meth:`add_relationship` would.
+
+        Index lookups are bound once for the whole batch instead of per edge.
+        """
+        if self._pending_rels is not None:
+            self._pending_rels.extend(rels)
+            return
+        all_rels = self._relationships
+        by_type = self._by_rel_type
+        outgoing = self._outgoing
+        incoming = self._incoming
+        for rel in rels:
+            old = all_rels.get(rel.id)
+            if old is not None:
+                by_type[old.type].pop(rel.id, None)
+                outgoing[old.source].pop(rel.id, None)
+                incoming[old.target].pop(rel.id, None)
+            all_rels[rel.id] = rel
+            by_type[rel.type][rel.id] = rel
+            outgoing[rel.source][rel.id] = rel
+            incoming[rel.target][rel.id] = rel
+        self._version += 1
 
     def get_nodes_by_label(self, label: NodeLabel) -> list[GraphNode]:
         """Return all nodes whose label matches *label*."""
         return list(self._by_label.get(label, {}).values())
 
+    def iter_nodes_by_label(self, label: NodeLabel) -> Iterator[GraphNode]:
+        """Yield nodes whose label matches *label* without building a list.
+
+        The graph must not be mutated while the iterator is being consumed.
+        """
+        return iter(self._by_label.get(label, {}).values())
+
+    def methods_of_class(self, file_path: str, class_name: str) -> list[GraphNode]:
+        """Return the METHOD nodes in *file_path* whose ``class_name`` matches."""
+        return list(self._methods_by_class.get((file_path, class_name), {}).values())
+
     def get_relationships_by_type(self, rel_type: RelType) -> list[GraphRelationship]:
         """Return all relationships whose type matches *rel_type*."""
         return list(self._by_rel_type.get(rel_type, {}).values())
 
+    def iter_relationships_by_type(self, rel_type: RelType) -> Iterator[GraphRelationship]:
+        """Yield relationships whose type matches *rel_type* without building a list.
+
+        The graph must not be mutated while the iterator is being consumed.
+        """
+        return iter(self._by_rel_type.get(rel_type, {}).values())
+
     def get_outgoing(
         self, node_id: str, rel_type: RelType | None = None
     ) -> list[GraphRelationship]:
@@ -137,10 +307,7 @@ class KnowledgeGraph:
 
         If *rel_type* is given, only relationships of that type are returned.
         """
-        rels = self._outgoing.get(node_id, {})
-        if rel_type is None:
-            return list(rels.values())
-        return [r for r in rels.values() if r.type == rel_type]
+        return list(self.iter_outgoing(node_id, rel_type))
 
     def get_incoming(
         self, node_id: str, rel_type: RelType | None = None
@@ -149,26 +316,61 @@ class KnowledgeGraph:
 
         If *rel_type* is given, only relationships of that type are returned.
         """
-        rels = self._incoming.get(node_id, {})
+        return list(self.iter_incoming(node_id, rel_type))
+
+    def iter_outgoing(
+        self, node_id: str, rel_type: RelType | None = None
+    ) -> Iterator[GraphRelationship]:
+        """Yield relationships originating from *node_id* without building a list.
+
+        The graph must not be mutated while the iterator is being consumed.
+        """
+        rels = self._outgoing.get(node_id, {}).values()
+        if rel_type is None:
+            return iter(rels)
+        return (r for r in rels if r.type is rel_type)
+
+    def iter_incoming(
+        self, node_id: str, rel_type: RelType | None = None
+    ) -> Iterator[GraphRelationship]:
+        """Yield relationships targeting *node_id* without building a list.
+
+        The graph must not be mutated while the iterator is being consumed.
+        """
+        rels = self._incoming.get(node_id, {}).values()
         if rel_type is None:
-            return list(rels.values())
-        return [r for r in rels.values() if r.type == rel_type]
+            return iter(rels)
+        return (r for r in rels if r.type is rel_type)
 
     def stats(self) -> dict[str, int]:
         """Return a summary of graph size."""
         return {"nodes": len(self._nodes), "relationships": len(self._relationships)}
 
+    def label_counts(self) -> dict[NodeLabel, int]:
+        """Return the number of nodes per label, omitting labels with none.
+
+        Read from the label index bucket sizes, so the cost does not grow
+        with the size of the graph.
+        """
+        return {label: len(nodes) for label, nodes in self._by_label.items() if nodes}
+
+    def rel_type_counts(self) -> dict[RelType, int]:
+        """Return the number of relationships per type, omitting types with none."""
+        return {t: len(rels) for t, rels in self._by_rel_type.items() if rels}
+
     def _cascade_relationships_for_node(self, node_id: str) -> None:
         """Remove all relationships where *node_id* is source or target."""
-        out_rels = list(self._outgoing.pop(node_id, {}).values())
-        for rel in out_rels:
-            self._relationships.pop(rel.id, None)
-            self._by_rel_type.get(rel.type, {}).pop(rel.id, None)
+        # The popped buckets are detached from the index, so they can be
+        # iterated directly while the other indexes are edited.
+        all_rels = self._relationships
+        by_type = self._by_rel_type
+        for rel in self._outgoing.pop(node_id, {}).values():
+            all_rels.pop(rel.id, None)
+            by_type.get(rel.type, {}).pop(rel.id, None)
             self._incoming.get(rel.target, {}).pop(rel.id, None)
 
-        in_rels = list(self._incoming.pop(node_id, {}).values())
-        for rel in in_rels:
-            self._relationships.pop(rel.id, None)
-            self._by_rel_type.get(rel.type, {}).pop(rel.id, None)
+        for rel in self._incoming.pop(node_id, {}).values():
+            all_rels.pop(rel.id, None)
+            by_type.get(rel.type, {}).pop(rel.id, None)
             self._outgoing.get(rel.source, {}).pop(rel.id, None)
 
@@ -7,6 +7,7 @@ entities (files, functions, classes, etc.) and the edges between them
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -64,11 +65,17 @@ class RelType(Enum):
     RENDERS = "renders"
     INCLUDES = "includes"
 
+# "<label value>:" per label; Enum.value is a descriptor lookup on every call.
+_LABEL_PREFIX: dict[NodeLabel, str] = {label: f"{label.value}:" for label in NodeLabel}
+
 def generate_id(label: NodeLabel, file_path: str, symbol_name: str = "") -> str:
     """Produce a deterministic node ID.
 
     Format: ``{label.value}:{file_path}:{symbol_name}``
 
+    IDs are composed, not hashed: they stay human-readable, are cheap to
+    build on the ingestion hot path, and cannot collide for distinct inputs.
+
     Args:
         label: The node label enum member.
         file_path: Path to the file the symbol belongs to.
@@ -77,9 +84,9 @@ def generate_id(label: NodeLabel, file_path: str, symbol_name: str = "") -> str:
     Returns:
         A colon-separated string suitable for use as a graph node ID.
     """
-    return f"{label.value}:{file_path}:{symbol_name}"
+    return f"{_LABEL_PREFIX[label]}{file_path}:{symbol_name}"
 
-@dataclass
+@dataclass(slots=True)
 class GraphNode:
     """A node in the knowledge graph representing a code entity.
 
@@ -105,7 +112,15 @@ class GraphNode:
 
     properties: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+    def __post_init__(self) -> None:
+        # Many nodes share a file and class; intern so they share one string.
+        # sys.intern only takes exact str, so leave None and the like alone.
+        if type(self.file_path) is str and self.file_path:
+            self.file_path = sys.intern(self.file_path)
+        if type(self.class_name) is str and self.class_name:
+            self.class_name = sys.intern(self.class_name)
+
+@dataclass(slots=True)
 class GraphRelationship:
     """A directed edge in the knowledge graph.
 
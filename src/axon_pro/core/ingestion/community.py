@@ -50,7 +50,7 @@ def export_to_igraph(
     index_to_node_id: dict[int, str] = {}
 
     for label in _CALLABLE_LABELS:
-        for node in graph.get_nodes_by_label(label):
+        for node in graph.iter_nodes_by_label(label):
             idx = len(node_id_to_index)
             node_id_to_index[node.id] = idx
             index_to_node_id[idx] = node.id
@@ -58,7 +58,7 @@ def export_to_igraph(
     num_vertices = len(node_id_to_index)
 
     edge_list: list[tuple[int, int]] = []
-    for rel in graph.get_relationships_by_type(RelType.CALLS):
+    for rel in graph.iter_relationships_by_type(RelType.CALLS):
         src_idx = node_id_to_index.get(rel.source)
         tgt_idx = node_id_to_index.get(rel.target)
         if src_idx is not None and tgt_idx is not None:
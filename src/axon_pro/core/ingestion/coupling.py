@@ -13,21 +13,22 @@ builds a co-change matrix, computes coupling strengths, and writes
 from __future__ import annotations
 
 import logging
+import math
 import subprocess
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Sequence
 from itertools import combinations
 from pathlib import Path
 
 from axon_pro.core.graph.graph import KnowledgeGraph
-from axon_pro.core.graph.model import (
-    GraphRelationship,
-    NodeLabel,
-    RelType,
-    generate_id,
-)
+from axon_pro.core.graph.model import GraphRelationship, NodeLabel, RelType
 
 logger = logging.getLogger(__name__)
 
+# Below this many commits the pure-Python counter beats the cost of importing
+# scipy and building the sparse incidence matrix.
+_SPARSE_MIN_COMMITS = 64
+
 def parse_git_log(
     repo_path: Path,
     since_months: int = 6,
@@ -119,16 +120,77 @@ def build_cochange_matrix(
     Returns:
         A dict mapping ``(file_a, file_b)`` sorted tuples to their count.
     """
-    counts: dict[tuple[str, str], int] = defaultdict(int)
+    # Count on small-int keys: tuples of ints hash far cheaper than tuples
+    # of long path strings.  Paths are mapped back once at the end.
+    path_ids: dict[str, int] = {}
+    commit_ids: list[list[int]] = []
 
+    # Canonicalize every commit once up front: deduplicated, sorted, and
+    # dropped entirely when it cannot contribute a pair.
     for files in commits:
-        unique_files = sorted(set(files))
-        if len(unique_files) > max_files_per_commit:
+        if len(files) < 2:
             continue
-        for a, b in combinations(unique_files, 2):
-            counts[(a, b)] += 1
-
-    return {pair: count for pair, count in counts.items() if count >= min_cochanges}
+        unique_ids = sorted({path_ids.setdefault(f, len(path_ids)) for f in files})
+        if not 2 <= len(unique_ids) <= max_files_per_commit:
+            continue
+        commit_ids.append(unique_ids)
+
+    counts: Iterable[tuple[tuple[int, int], int]] | None = None
+    if len(commit_ids) >= _SPARSE_MIN_COMMITS:
+        counts = _count_pairs_sparse(commit_ids, len(path_ids))
+    if counts is None:
+        counter: Counter[tuple[int, int]] = Counter()
+        for unique_ids in commit_ids:
+            # Counter.update consumes the combinations iterator in C.
+            counter.update(combinations(unique_ids, 2))
+        counts = counter.items()
+
+    paths = list(path_ids)
+    matrix: dict[tuple[str, str], int] = {}
+    for (id_a, id_b), count in counts:
+        if count < min_cochanges:
+            continue
+        file_a, file_b = paths[id_a], paths[id_b]
+        matrix[(file_a, file_b) if file_a < file_b else (file_b, file_a)] = count
+    return matrix
+
+def _count_pairs_sparse(
+    commit_ids: list[list[int]],
+    file_count: int,
+) -> list[tuple[tuple[int, int], int]] | None:
+    """Count co-changing file pairs as ``A.T @ A`` over a sparse incidence matrix.
+
+    ``A`` has one row per commit and one column per file.  The upper triangle
+    of the product holds the pair counts, computed in a single sparse matrix
+    multiply instead of a Python loop per pair.
+
+    Returns ``None`` when scipy is not installed so the caller can fall back
+    to the pure-Python counter.
+    """
+    try:
+        import numpy as np
+        import scipy.sparse as sp
+    except ImportError:
+        return None
+
+    rows = np.repeat(
+        np.arange(len(commit_ids), dtype=np.int64),
+        [len(ids) for ids in commit_ids],
+    )
+    cols = np.fromiter(
+        (fid for ids in commit_ids for fid in ids), dtype=np.int64, count=len(rows)
+    )
+    incidence = sp.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(len(commit_ids), file_count),
+    )
+    cochange = sp.triu(incidence.T @ incidence, k=1).tocoo()
+    return [
+        ((id_a, id_b), count)
+        for id_a, id_b, count in zip(
+            cochange.row.tolist(), cochange.col.tolist(), cochange.data.tolist()
+        )
+    ]
 
 def calculate_coupling(
     file_a: str,
@@ -158,6 +220,41 @@ def calculate_coupling(
         return 0.0
     return co_changes / max_changes
 
+def calculate_coupling_bulk(
+    pairs: Sequence[tuple[str, str]],
+    co_changes: Sequence[int],
+    total_changes: dict[str, int],
+) -> list[float]:
+    """Compute :func:`calculate_coupling` for many file pairs at once.
+
+    The per-pair totals are gathered into NumPy arrays and divided in one
+    vectorized operation, avoiding a Python function call per pair.  Falls
+    back to the scalar function when NumPy is not installed.
+
+    Args:
+        pairs: ``(file_a, file_b)`` tuples.
+        co_changes: Co-change count for each pair, aligned with *pairs*.
+        total_changes: Mapping of file path to its total commit count.
+
+    Returns:
+        Coupling strengths aligned with *pairs*.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return [
+            calculate_coupling(file_a, file_b, co, total_changes)
+            for (file_a, file_b), co in zip(pairs, co_changes)
+        ]
+
+    n = len(pairs)
+    totals_a = np.fromiter((total_changes.get(a, 0) for a, _ in pairs), dtype=np.int64, count=n)
+    totals_b = np.fromiter((total_changes.get(b, 0) for _, b in pairs), dtype=np.int64, count=n)
+    co = np.fromiter(co_changes, dtype=np.float64, count=n)
+    max_changes = np.maximum(totals_a, totals_b)
+    strengths = np.divide(co, max_changes, out=np.zeros(n), where=max_changes > 0)
+    return strengths.tolist()
+
 def process_coupling(
     graph: KnowledgeGraph,
     repo_path: Path,
@@ -187,27 +284,44 @@ def process_coupling(
     if commits is None:
         commits = parse_git_log(repo_path, graph_files=graph_files)
 
-    # Build co-change matrix (threshold of 1 — we filter by strength later).
-    cochange = build_cochange_matrix(commits, min_cochanges=1)
-
     # Count total changes per file (across all commits).
     total_changes: dict[str, int] = defaultdict(int)
     for files in commits:
         for f in set(files):
             total_changes[f] += 1
 
+    # A kept pair needs co_changes >= min_strength * max(total_a, total_b),
+    # and that maximum is at least the smallest per-file total.  Pushing this
+    # bound into the matrix drops weak pairs before any strength is computed.
+    # The epsilon keeps float error (0.3 * 10 == 3.0000000000000004) from
+    # rounding a qualifying count up and out.
+    min_total = min(total_changes.values(), default=1)
+    min_cochanges = max(1, math.ceil(min_strength * min_total - 1e-9))
+    cochange = build_cochange_matrix(commits, min_cochanges=min_cochanges)
+
+    # Resolve each path to its File node id once, and drop pairs with an
+    # endpoint outside the graph before any strength is computed.
     path_to_id: dict[str, str] = {n.file_path: n.id for n in file_nodes}
-
-    count = 0
+    pairs: list[tuple[str, str]] = []
+    endpoint_ids: list[tuple[str, str]] = []
+    co_change_counts: list[int] = []
     for (file_a, file_b), co_changes in cochange.items():
-        strength = calculate_coupling(file_a, file_b, co_changes, total_changes)
-        if strength < min_strength:
-            continue
-
         id_a = path_to_id.get(file_a)
         id_b = path_to_id.get(file_b)
         if id_a is None or id_b is None:
             continue
+        pairs.append((file_a, file_b))
+        endpoint_ids.append((id_a, id_b))
+        co_change_counts.append(co_changes)
+
+    strengths = calculate_coupling_bulk(pairs, co_change_counts, total_changes)
+
+    count = 0
+    for (id_a, id_b), co_changes, strength in zip(
+        endpoint_ids, co_change_counts, strengths
+    ):
+        if strength < min_strength:
+            continue
 
         rel_id = f"coupled:{id_a}->{id_b}"
         graph.add_relationship(
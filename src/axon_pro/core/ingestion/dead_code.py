@@ -151,20 +151,20 @@ def _clear_override_false_positives(graph: KnowledgeGraph) -> int:
     """
     # Build a mapping: class_name -> set of method names that are NOT dead.
     alive_methods_by_class: dict[str, set[str]] = {}
-    for method in graph.get_nodes_by_label(NodeLabel.METHOD):
+    for method in graph.iter_nodes_by_label(NodeLabel.METHOD):
         if not method.is_dead and method.class_name:
             alive_methods_by_class.setdefault(method.class_name, set()).add(method.name)
 
     # Build child -> parent class mapping from EXTENDS relationships.
     child_to_parents: dict[str, list[str]] = {}
-    for rel in graph.get_relationships_by_type(RelType.EXTENDS):
+    for rel in graph.iter_relationships_by_type(RelType.EXTENDS):
         child_node = graph.get_node(rel.source)
         parent_node = graph.get_node(rel.target)
         if child_node and parent_node:
             child_to_parents.setdefault(child_node.name, []).append(parent_node.name)
 
     cleared = 0
-    for method in graph.get_nodes_by_label(NodeLabel.METHOD):
+    for method in graph.iter_nodes_by_label(NodeLabel.METHOD):
         if not method.is_dead or not method.class_name:
             continue
 
@@ -198,11 +198,11 @@ def _clear_protocol_conformance_false_positives(graph: KnowledgeGraph) -> int:
     Returns the number of methods un-flagged.
     """
     protocol_methods: dict[str, set[str]] = {}
-    for cls_node in graph.get_nodes_by_label(NodeLabel.CLASS):
+    for cls_node in graph.iter_nodes_by_label(NodeLabel.CLASS):
         if not cls_node.properties.get("is_protocol"):
             continue
         methods = set()
-        for method in graph.get_nodes_by_label(NodeLabel.METHOD):
+        for method in graph.iter_nodes_by_label(NodeLabel.METHOD):
             if method.class_name == cls_node.name and not _is_dunder(method.name):
                 methods.add(method.name)
         if methods:
@@ -212,7 +212,7 @@ def _clear_protocol_conformance_false_positives(graph: KnowledgeGraph) -> int:
         return 0
 
     class_methods: dict[str, set[str]] = {}
-    for method in graph.get_nodes_by_label(NodeLabel.METHOD):
+    for method in graph.iter_nodes_by_label(NodeLabel.METHOD):
         if method.class_name:
             class_methods.setdefault(method.class_name, set()).add(method.name)
 
@@ -228,7 +228,7 @@ def _clear_protocol_conformance_false_positives(graph: KnowledgeGraph) -> int:
         return 0
 
     cleared = 0
-    for method in graph.get_nodes_by_label(NodeLabel.METHOD):
+    for method in graph.iter_nodes_by_label(NodeLabel.METHOD):
         if not method.is_dead or not method.class_name:
             continue
         names_to_clear = clearable.get(method.class_name)
@@ -253,7 +253,7 @@ def _clear_protocol_stub_false_positives(graph: KnowledgeGraph) -> int:
     Returns the number of methods un-flagged.
     """
     protocol_class_names: set[str] = set()
-    for cls_node in graph.get_nodes_by_label(NodeLabel.CLASS):
+    for cls_node in graph.iter_nodes_by_label(NodeLabel.CLASS):
         if cls_node.properties.get("is_protocol"):
             protocol_class_names.add(cls_node.name)
 
@@ -261,7 +261,7 @@ def _clear_protocol_stub_false_positives(graph: KnowledgeGraph) -> int:
         return 0
 
     cleared = 0
-    for method in graph.get_nodes_by_label(NodeLabel.METHOD):
+    for method in graph.iter_nodes_by_label(NodeLabel.METHOD):
         if not method.is_dead or not method.class_name:
             continue
         if method.class_name in protocol_class_names:
@@ -310,7 +310,7 @@ def process_dead_code(graph: KnowledgeGraph) -> int:
     dead_count = 0
 
     for label in _SYMBOL_LABELS:
-        for node in graph.get_nodes_by_label(label):
+        for node in graph.iter_nodes_by_label(label):
             if _is_exempt(node.name, node.is_entry_point, node.is_exported, node.file_path):
                 continue
             if graph.has_incoming(node.id, RelType.CALLS):
@@ -49,6 +49,9 @@ def _resolve_node(
     candidate_ids = symbol_index.get(name)
     if not candidate_ids:
         return None
+    if len(candidate_ids) == 1:
+        # Same-file or not, a lone candidate is the answer; skip the fetch.
+        return candidate_ids[0]
 
     for nid in candidate_ids:
         node = graph.get_node(nid)
@@ -71,11 +74,15 @@ def process_heritage(
     * If either node cannot be resolved (e.g. an external parent class),
       the tuple is silently skipped.
 
+    Resolved relationships are collected and added to the graph in one
+    :meth:`~KnowledgeGraph.add_relationships` call at the end.
+
     Args:
         parse_data: File parse results produced by the parser phase.
         graph: The knowledge graph to populate with heritage relationships.
     """
     symbol_index = build_name_index(graph, _HERITAGE_LABELS)
+    new_rels: list[GraphRelationship] = []
 
     for fpd in parse_data:
         for class_name, kind, parent_name in fpd.parse_result.heritage:
@@ -92,10 +99,6 @@ def process_heritage(
             child_id = _resolve_node(
                 class_name, fpd.file_path, symbol_index, graph
             )
-            parent_id = _resolve_node(
-                parent_name, fpd.file_path, symbol_index, graph
-            )
-
             if child_id is None:
                 logger.debug(
                     "Skipping heritage %s %s %s in %s: unresolved child",
@@ -106,6 +109,10 @@ def process_heritage(
                 )
                 continue
 
+            parent_id = _resolve_node(
+                parent_name, fpd.file_path, symbol_index, graph
+            )
+
             if parent_id is None:
                 # Parent is external.  If it is a protocol/ABC marker,
                 # annotate the child so dead-code detection can leverage
@@ -131,7 +138,7 @@ def process_heritage(
                 continue
 
             rel_id = f"{kind}:{child_id}->{parent_id}"
-            graph.add_relationship(
+            new_rels.append(
                 GraphRelationship(
                     id=rel_id,
                     type=rel_type,
@@ -139,3 +146,5 @@ def process_heritage(
                     target=parent_id,
                 )
             )
+
+    graph.add_relationships(new_rels)
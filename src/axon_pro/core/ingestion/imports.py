@@ -8,7 +8,6 @@ relationships between the importing file and the target file.
 from __future__ import annotations
 
 import logging
-from pathlib import PurePosixPath
 
 from axon_pro.core.graph.graph import KnowledgeGraph
 from axon_pro.core.graph.model import (
@@ -27,7 +26,7 @@ _JS_TS_EXTENSIONS = (".ts", ".js", ".tsx", ".jsx")
 def build_file_index(graph: KnowledgeGraph) -> dict[str, str]:
     """Build an index mapping file paths to their graph node IDs.
 
-    Iterates over all :pyclass:`NodeLabel.FILE` nodes in the graph and
+    Iterates over the graph's :pyclass:`NodeLabel.FILE` bucket and
     returns a dict keyed by ``file_path`` with node ``id`` as value.
 
     Args:
@@ -36,8 +35,7 @@ def build_file_index(graph: KnowledgeGraph) -> dict[str, str]:
     Returns:
         A dict like ``{"src/auth/validate.py": "file:src/auth/validate.py:"}``.
     """
-    file_nodes = graph.get_nodes_by_label(NodeLabel.FILE)
-    return {node.file_path: node.id for node in file_nodes}
+    return {node.file_path: node.id for node in graph.iter_nodes_by_label(NodeLabel.FILE)}
 
 def resolve_import_path(
     importing_file: str,
@@ -78,6 +76,8 @@ def process_imports(
     For each file's parsed imports, resolves the target file and creates
     an ``IMPORTS`` relationship from the importing file node to the target
     file node.  Duplicate edges (same source -> same target) are skipped.
+    The edges are added to the graph in one
+    :meth:`~KnowledgeGraph.add_relationships` call at the end.
 
     Args:
         parse_data: Parse results from the parsing phase.
@@ -85,6 +85,7 @@ def process_imports(
     """
     file_index = build_file_index(graph)
     seen: set[tuple[str, str]] = set()
+    new_rels: list[GraphRelationship] = []
 
     for fpd in parse_data:
         source_file_id = generate_id(NodeLabel.FILE, fpd.file_path)
@@ -100,7 +101,7 @@ def process_imports(
             seen.add(pair)
 
             rel_id = f"imports:{source_file_id}->{target_id}"
-            graph.add_relationship(
+            new_rels.append(
                 GraphRelationship(
                     id=rel_id,
                     type=RelType.IMPORTS,
@@ -110,9 +111,21 @@ def process_imports(
                 )
             )
 
+    graph.add_relationships(new_rels)
+
+def _path_parts(path: str) -> list[str]:
+    """Split a relative POSIX *path* into parts, normalised like ``PurePosixPath``.
+
+    Empty and ``.`` components are dropped; ``..`` is kept as-is.
+    """
+    return [part for part in path.split("/") if part and part != "."]
+
 def _detect_language(file_path: str) -> str:
     """Infer language from a file's extension."""
-    suffix = PurePosixPath(file_path).suffix.lower()
+    # Same suffix rule as PurePosixPath.suffix, without building a path object.
+    name = file_path[file_path.rfind("/") + 1:]
+    dot = name.rfind(".")
+    suffix = name[dot:].lower() if 0 < dot < len(name) - 1 else ""
     if suffix == ".py":
         return "python"
     if suffix in (".ts", ".tsx"):
@@ -163,17 +176,14 @@ def _resolve_python_relative(
 
     remainder = module[dot_count:]
 
-    base = PurePosixPath(importing_file).parent
-    for _ in range(dot_count - 1):
-        base = base.parent
+    # Parent directory of the importing file, then one level up per extra dot.
+    parts = _path_parts(importing_file)[:-1]
+    levels_up = dot_count - 1
+    if levels_up > 0:
+        del parts[-levels_up:]
 
-    if remainder:
-        segments = remainder.split(".")
-        target_dir = base / PurePosixPath(*segments)
-    else:
-        target_dir = base
-
-    return _try_python_paths(str(target_dir), file_index)
+    parts.extend(filter(None, remainder.split(".")))
+    return _try_python_paths("/".join(parts) or ".", file_index)
 
 def _resolve_python_absolute(
     import_info: ImportInfo,
@@ -186,8 +196,7 @@ def _resolve_python_absolute(
     in the project.
     """
     module = import_info.module
-    segments = module.split(".")
-    target_path = str(PurePosixPath(*segments))
+    target_path = "/".join(filter(None, module.split("."))) or "."
     return _try_python_paths(target_path, file_index)
 
 def _try_python_paths(base_path: str, file_index: dict[str, str]) -> str | None:
@@ -222,12 +231,9 @@ def _resolve_js_ts(
     if not module.startswith("."):
         return None
 
-    base = PurePosixPath(importing_file).parent
-    resolved = base / module
-
-    resolved_str = str(PurePosixPath(*resolved.parts))
-
-    return _try_js_ts_paths(resolved_str, file_index)
+    parts = _path_parts(importing_file)[:-1]
+    parts.extend(_path_parts(module))
+    return _try_js_ts_paths("/".join(parts) or ".", file_index)
 
 def _try_js_ts_paths(base_path: str, file_index: dict[str, str]) -> str | None:
     """Try common JS/TS file resolution patterns for *base_path*.
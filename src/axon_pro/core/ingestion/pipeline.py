@@ -159,7 +159,7 @@ def run_pipeline(
         storage.bulk_load(graph)
         report("Loading to storage", 1.0)
 
-    result.symbols = sum(1 for n in graph.iter_nodes() if n.label in _SYMBOL_LABELS)
+    result.symbols = sum(graph.count_nodes_by_label(label) for label in _SYMBOL_LABELS)
     result.relationships = graph.relationship_count
     result.duration_seconds = time.monotonic() - start
 
@@ -58,7 +58,7 @@ def find_entry_points(graph: KnowledgeGraph) -> list[GraphNode]:
     entry_points: list[GraphNode] = []
 
     for label in _CALLABLE_LABELS:
-        for node in graph.get_nodes_by_label(label):
+        for node in graph.iter_nodes_by_label(label):
             if _is_entry_point(node, graph):
                 node.is_entry_point = True
                 entry_points.append(node)
@@ -75,8 +75,7 @@ def _is_entry_point(node: GraphNode, graph: KnowledgeGraph) -> bool:
     if _matches_framework_pattern(node):
         return True
 
-    incoming_calls = graph.get_incoming(node.id, RelType.CALLS)
-    if incoming_calls:
+    if graph.has_incoming(node.id, RelType.CALLS):
         return False
 
     if node.is_exported:
@@ -245,8 +244,7 @@ def _determine_kind(steps: list[GraphNode], graph: KnowledgeGraph) -> str:
     has_any = False
 
     for step in steps:
-        member_rels = graph.get_outgoing(step.id, RelType.MEMBER_OF)
-        for rel in member_rels:
+        for rel in graph.iter_outgoing(step.id, RelType.MEMBER_OF):
             has_any = True
             communities.add(rel.target)
 
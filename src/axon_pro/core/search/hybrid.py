@@ -12,10 +12,23 @@ from dominating, *rank_r(d)* is the 1-based position of document *d* in ranker
 
 from __future__ import annotations
 
+import heapq
+from collections import OrderedDict
 from dataclasses import replace
+from operator import itemgetter
+from weakref import WeakKeyDictionary
 
 from axon_pro.core.storage.base import SearchResult, StorageBackend
 
+_RESULT_CACHE_SIZE = 256
+
+# Fused results per storage backend, tagged with the backend version they
+# were computed at.  Only backends exposing an integer ``version`` that every
+# write bumps are cached; a write drops that backend's entries.
+_result_cache: WeakKeyDictionary[
+    StorageBackend,
+    tuple[int, OrderedDict[tuple[object, ...], list[SearchResult]]],
+] = WeakKeyDictionary()
 
 def hybrid_search(
     query: str,
@@ -41,10 +54,50 @@ def hybrid_search(
     Returns:
         Merged list of :class:`SearchResult` sorted by combined RRF score,
         highest first.
+
+    Results are memoized per backend until its ``version`` changes, for the
+    most recent ``_RESULT_CACHE_SIZE`` distinct argument sets.  Repeat calls
+    return copies of the cached :class:`SearchResult` objects, so callers
+    may modify what they get back.
     """
     if limit <= 0:
         return []
 
+    version = getattr(storage, "version", None)
+    if not isinstance(version, int):
+        return _search(
+            query, storage, query_embedding, limit, fts_weight, vector_weight, rrf_k
+        )
+
+    cached = _result_cache.get(storage)
+    if cached is None or cached[0] != version:
+        cached = (version, OrderedDict())
+        _result_cache[storage] = cached
+    entries = cached[1]
+
+    embedding_key = None if query_embedding is None else tuple(query_embedding)
+    key = (query, embedding_key, limit, fts_weight, vector_weight, rrf_k)
+    results = entries.get(key)
+    if results is None:
+        results = entries[key] = _search(
+            query, storage, query_embedding, limit, fts_weight, vector_weight, rrf_k
+        )
+        if len(entries) > _RESULT_CACHE_SIZE:
+            entries.popitem(last=False)
+    else:
+        entries.move_to_end(key)
+    return [replace(result) for result in results]
+
+def _search(
+    query: str,
+    storage: StorageBackend,
+    query_embedding: list[float] | None,
+    limit: int,
+    fts_weight: float,
+    vector_weight: float,
+    rrf_k: int,
+) -> list[SearchResult]:
+    """Query both sources and fuse their rankings; see :func:`hybrid_search`."""
     candidate_limit = limit * 3
 
     # Step 1: gather ranked lists from each source
@@ -58,22 +111,45 @@ def hybrid_search(
     if query_embedding is not None:
         vector_results = storage.vector_search(query_embedding, limit=candidate_limit)
 
+    # A lone ranked list needs no fusion: its RRF scores fall with rank, so
+    # the first occurrences are already in score order.
+    if not vector_results and fts_weight >= 0:
+        return _rank_single_list(fts_results, fts_weight, rrf_k, limit)
+
     rrf_scores: dict[str, float] = {}
     metadata: dict[str, SearchResult] = {}
 
     _accumulate_ranks(fts_results, fts_weight, rrf_k, rrf_scores, metadata)
     _accumulate_ranks(vector_results, vector_weight, rrf_k, rrf_scores, metadata)
 
-    merged: list[SearchResult] = []
-    for node_id, score in rrf_scores.items():
-        source = metadata[node_id]
-        merged.append(
-            replace(source, score=score),
-        )
+    # nlargest matches sorted(..., reverse=True)[:limit], ties included, and
+    # only the survivors get copied with their fused score.
+    top = heapq.nlargest(limit, rrf_scores.items(), key=itemgetter(1))
+    return [replace(metadata[node_id], score=score) for node_id, score in top]
 
-    merged.sort(key=lambda r: r.score, reverse=True)
+def _rank_single_list(
+    results: list[SearchResult],
+    weight: float,
+    k: int,
+    limit: int,
+) -> list[SearchResult]:
+    """Score one ranked list with RRF, keeping its order.
+
+    Matches what fusing *results* alone would return: duplicates after the
+    first occurrence are dropped and at most *limit* results are kept.
+    """
+    ranked: list[SearchResult] = []
+    seen: set[str] = set()
+    for denominator, result in enumerate(results, k + 1):
+        nid = result.node_id
+        if nid in seen:
+            continue
+        seen.add(nid)
 
-    return merged[:limit]
+        ranked.append(replace(result, score=weight / denominator))
+        if len(ranked) == limit:
+            break
+    return ranked
 
 def _accumulate_ranks(
     results: list[SearchResult],
@@ -88,14 +164,14 @@ def _accumulate_ranks(
     (i.e. duplicates within the same list are ignored).
     """
     seen: set[str] = set()
-    for rank_0, result in enumerate(results):
+    # Counting from k + 1 yields k + rank directly (rank is 1-based).
+    for denominator, result in enumerate(results, k + 1):
         nid = result.node_id
         if nid in seen:
             continue
         seen.add(nid)
 
-        rank_1 = rank_0 + 1  # 1-based rank
-        scores[nid] = scores.get(nid, 0.0) + weight / (k + rank_1)
+        scores[nid] = scores.get(nid, 0.0) + weight / denominator
 
         # Keep the first metadata we encounter for this node
         if nid not in metadata:
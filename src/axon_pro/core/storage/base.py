@@ -7,13 +7,17 @@ supporting data classes for search results and embeddings.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from axon_pro.core.graph.graph import KnowledgeGraph
 from axon_pro.core.graph.model import GraphNode, GraphRelationship
 
+if TYPE_CHECKING:
+    import numpy as np
+
 @dataclass
 class SearchResult:
     """A single result from a full-text or vector search."""
@@ -27,10 +31,15 @@ class SearchResult:
 
 @dataclass
 class NodeEmbedding:
-    """An embedding vector associated with a graph node."""
+    """An embedding vector associated with a graph node.
+
+    ``embedding`` is either a float sequence such as ``list[float]`` or, as
+    produced by :func:`~axon_pro.core.embeddings.embedder.embed_graph`, a
+    1-D float32 ``numpy`` array, which is not a :class:`Sequence`.
+    """
 
     node_id: str
-    embedding: list[float] = field(default_factory=list)
+    embedding: Sequence[float] | np.ndarray = field(default_factory=list)
 
 @runtime_checkable
 class StorageBackend(Protocol):
@@ -90,6 +90,15 @@ class KuzuBackend:
     def __init__(self) -> None:
         self._db: kuzu.Database | None = None
         self._conn: kuzu.Connection | None = None
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped by every method that writes through this backend.
+
+        Lets callers cache query results and know when to drop them.
+        """
+        return self._version
 
     def initialize(self, path: Path, *, read_only: bool = False) -> None:
         """Open or create the KuzuDB database at *path* and set up the schema.
@@ -113,6 +122,7 @@ class KuzuBackend:
             buffer_pool_size=buffer_pool_size
         )
         self._conn = kuzu.Connection(self._db)
+        self._version += 1
         if not read_only:
             self._create_schema()
 
@@ -137,11 +147,13 @@ class KuzuBackend:
 
     def add_nodes(self, nodes: list[GraphNode]) -> None:
         """Insert nodes into their respective label tables."""
+        self._version += 1
         for node in nodes:
             self._insert_node(node)
 
     def add_relationships(self, rels: list[GraphRelationship]) -> None:
         """Insert relationships by matching source and target nodes."""
+        self._version += 1
         for rel in rels:
             self._insert_relationship(rel)
 
@@ -152,6 +164,7 @@ class KuzuBackend:
             Always 0 — exact count is not tracked for performance.
         """
         assert self._conn is not None
+        self._version += 1
         for table in _NODE_TABLE_NAMES:
             try:
                 self._conn.execute(
@@ -260,7 +273,11 @@ class KuzuBackend:
         return result_list
 
     def execute_raw(self, query: str) -> list[list[Any]]:
-        """Execute a raw Cypher query and return all result rows."""
+        """Execute a raw Cypher query and return all result rows.
+
+        Does not bump :attr:`version`: every caller runs read-only queries,
+        and the cypher tool rejects write keywords before reaching here.
+        """
         assert self._conn is not None
         result = self._conn.execute(query)
         rows: list[list[Any]] = []
@@ -427,6 +444,7 @@ class KuzuBackend:
         Attempts batch CSV COPY FROM first, falls back to individual MERGE.
         """
         assert self._conn is not None
+        self._version += 1
         if not embeddings:
             return
 
@@ -434,10 +452,14 @@ class KuzuBackend:
             return
 
         for emb in embeddings:
+            vec = emb.embedding
+            # Kuzu parameters must be plain lists; numpy vectors are converted here.
+            if not isinstance(vec, list):
+                vec = [float(v) for v in vec]
             try:
                 self._conn.execute(
                     "MERGE (e:Embedding {node_id: $nid}) SET e.vec = $vec",
-                    parameters={"nid": emb.node_id, "vec": emb.embedding},
+                    parameters={"nid": emb.node_id, "vec": vec},
                 )
             except Exception:
                 logger.debug(
@@ -540,6 +562,7 @@ class KuzuBackend:
         falling back to individual inserts if COPY FROM fails.
         """
         assert self._conn is not None
+        self._version += 1
         for table in _NODE_TABLE_NAMES:
             try:
                 self._conn.execute(f"MATCH (n:{table}) DETACH DELETE n")
@@ -561,6 +584,7 @@ class KuzuBackend:
         reflect the current node contents.
         """
         assert self._conn is not None
+        self._version += 1
         for table in _NODE_TABLE_NAMES:
             idx_name = f"{table.lower()}_fts"
             try:
@@ -0,0 +1,40 @@
+"""Shared pytest configuration for the whole test suite."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip ``slow`` tests unless ``--runslow`` was given."""
+    if config.getoption("--runslow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="needs --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def vec_pool() -> np.ndarray:
+    """A read-only pool of 102 distinct 3-d float32 vectors; row i is [3i, 3i+1, 3i+2].
+
+    Tests that fake an embedding model hand out slices of this pool, which
+    are views rather than copies.
+    """
+    pool = np.arange(306, dtype=np.float32).reshape(102, 3)
+    pool.flags.writeable = False
+    return pool
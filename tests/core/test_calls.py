@@ -50,8 +50,14 @@ def _add_symbol_node(
     start_line: int,
     end_line: int,
     class_name: str = "",
+    *,
+    file_id: str,
 ) -> str:
-    """Add a symbol node with a DEFINES relationship from the file node."""
+    """Add a symbol node with a DEFINES relationship from the file node.
+
+    *file_id* is the ID returned by :func:`_add_file_node` for *file_path*,
+    passed in so callers adding many symbols to one file hash it only once.
+    """
     symbol_name = (
         f"{class_name}.{name}" if label == NodeLabel.METHOD and class_name else name
     )
@@ -67,7 +73,6 @@ def _add_symbol_node(
             class_name=class_name,
         )
     )
-    file_id = generate_id(NodeLabel.FILE, file_path)
     graph.add_relationship(
         GraphRelationship(
             id=f"defines:{file_id}->{node_id}",
@@ -96,19 +101,29 @@ def graph() -> KnowledgeGraph:
     g = KnowledgeGraph()
 
     # Files
-    _add_file_node(g, "src/auth.py")
-    _add_file_node(g, "src/app.py")
-    _add_file_node(g, "src/utils.py")
+    file_ids = {p: _add_file_node(g, p) for p in ("src/auth.py", "src/app.py", "src/utils.py")}
 
     # Symbols in src/auth.py
-    _add_symbol_node(g, NodeLabel.FUNCTION, "src/auth.py", "validate", 1, 10)
-    _add_symbol_node(g, NodeLabel.FUNCTION, "src/auth.py", "hash_password", 12, 20)
+    _add_symbol_node(
+        g, NodeLabel.FUNCTION, "src/auth.py", "validate", 1, 10,
+        file_id=file_ids["src/auth.py"],
+    )
+    _add_symbol_node(
+        g, NodeLabel.FUNCTION, "src/auth.py", "hash_password", 12, 20,
+        file_id=file_ids["src/auth.py"],
+    )
 
     # Symbols in src/app.py
-    _add_symbol_node(g, NodeLabel.FUNCTION, "src/app.py", "login", 1, 15)
+    _add_symbol_node(
+        g, NodeLabel.FUNCTION, "src/app.py", "login", 1, 15,
+        file_id=file_ids["src/app.py"],
+    )
 
     # Symbols in src/utils.py
-    _add_symbol_node(g, NodeLabel.FUNCTION, "src/utils.py", "helper", 1, 5)
+    _add_symbol_node(
+        g, NodeLabel.FUNCTION, "src/utils.py", "helper", 1, 5,
+        file_id=file_ids["src/utils.py"],
+    )
 
     return g
 
@@ -168,8 +183,10 @@ class TestBuildCallIndex:
     def test_build_call_index_includes_classes(self) -> None:
         """Class nodes are included (for constructor calls)."""
         g = KnowledgeGraph()
-        _add_file_node(g, "src/models.py")
-        _add_symbol_node(g, NodeLabel.CLASS, "src/models.py", "User", 1, 20)
+        file_id = _add_file_node(g, "src/models.py")
+        _add_symbol_node(
+            g, NodeLabel.CLASS, "src/models.py", "User", 1, 20, file_id=file_id
+        )
 
         index = build_name_index(g, _CALLABLE_LABELS)
         assert "User" in index
@@ -178,10 +195,10 @@ class TestBuildCallIndex:
     def test_build_call_index_multiple_same_name(self) -> None:
         """Multiple symbols with the same name produce a list with all IDs."""
         g = KnowledgeGraph()
-        _add_file_node(g, "src/a.py")
-        _add_file_node(g, "src/b.py")
-        _add_symbol_node(g, NodeLabel.FUNCTION, "src/a.py", "init", 1, 5)
-        _add_symbol_node(g, NodeLabel.FUNCTION, "src/b.py", "init", 1, 5)
+        a_id = _add_file_node(g, "src/a.py")
+        b_id = _add_file_node(g, "src/b.py")
+        _add_symbol_node(g, NodeLabel.FUNCTION, "src/a.py", "init", 1, 5, file_id=a_id)
+        _add_symbol_node(g, NodeLabel.FUNCTION, "src/b.py", "init", 1, 5, file_id=b_id)
 
         index = build_name_index(g, _CALLABLE_LABELS)
         assert "init" in index
@@ -366,7 +383,7 @@ class TestResolveMethodCallSelf:
     def test_resolve_method_call_self(self) -> None:
         g = KnowledgeGraph()
 
-        _add_file_node(g, "src/service.py")
+        file_id = _add_file_node(g, "src/service.py")
         _add_symbol_node(
             g,
             NodeLabel.CLASS,
@@ -374,6 +391,7 @@ class TestResolveMethodCallSelf:
             "AuthService",
             1,
             30,
+            file_id=file_id,
         )
         _add_symbol_node(
             g,
@@ -383,6 +401,7 @@ class TestResolveMethodCallSelf:
             3,
             15,
             class_name="AuthService",
+            file_id=file_id,
         )
         _add_symbol_node(
             g,
@@ -392,6 +411,7 @@ class TestResolveMethodCallSelf:
             17,
             28,
             class_name="AuthService",
+            file_id=file_id,
         )
 
         index = build_name_index(g, _CALLABLE_LABELS)
@@ -411,7 +431,7 @@ class TestResolveMethodCallSelf:
         """this.method() also resolves within the same class."""
         g = KnowledgeGraph()
 
-        _add_file_node(g, "src/service.ts")
+        file_id = _add_file_node(g, "src/service.ts")
         _add_symbol_node(
             g,
             NodeLabel.CLASS,
@@ -419,6 +439,7 @@ class TestResolveMethodCallSelf:
             "AuthService",
             1,
             30,
+            file_id=file_id,
         )
         _add_symbol_node(
             g,
@@ -428,6 +449,7 @@ class TestResolveMethodCallSelf:
             17,
             28,
             class_name="AuthService",
+            file_id=file_id,
         )
 
         index = build_name_index(g, _CALLABLE_LABELS)
@@ -456,19 +478,19 @@ class TestResolveCallImportResolved:
         g = KnowledgeGraph()
 
         # Two files: app.py imports validate from auth.py.
-        _add_file_node(g, "src/auth.py")
-        _add_file_node(g, "src/app.py")
+        auth_file_id = _add_file_node(g, "src/auth.py")
+        app_file_id = _add_file_node(g, "src/app.py")
 
         _add_symbol_node(
-            g, NodeLabel.FUNCTION, "src/auth.py", "validate", 1, 10
+            g, NodeLabel.FUNCTION, "src/auth.py", "validate", 1, 10,
+            file_id=auth_file_id,
         )
         _add_symbol_node(
-            g, NodeLabel.FUNCTION, "src/app.py", "login", 1, 15
+            g, NodeLabel.FUNCTION, "src/app.py", "login", 1, 15,
+            file_id=app_file_id,
         )
 
         # IMPORTS relationship: app.py -> auth.py with symbol "validate"
-        app_file_id = generate_id(NodeLabel.FILE, "src/app.py")
-        auth_file_id = generate_id(NodeLabel.FILE, "src/auth.py")
         g.add_relationship(
             GraphRelationship(
                 id=f"imports:{app_file_id}->{auth_file_id}",
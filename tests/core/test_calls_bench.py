@@ -0,0 +1,118 @@
+"""Benchmarks for the call tracing index and resolution path (Phase 5).
+
+These cases are skipped unless ``pytest-benchmark`` is installed.  They
+exist to catch cost regressions in :func:`build_name_index` and
+:func:`resolve_call`, which every ingestion run hits once per call site.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from axon_pro.core.graph.graph import KnowledgeGraph  # noqa: E402
+from axon_pro.core.graph.model import (  # noqa: E402
+    GraphNode,
+    GraphRelationship,
+    NodeLabel,
+    RelType,
+    generate_id,
+)
+from axon_pro.core.ingestion.calls import resolve_call  # noqa: E402
+from axon_pro.core.ingestion.symbol_lookup import build_name_index  # noqa: E402
+from axon_pro.core.parsers.base import CallInfo  # noqa: E402
+
+_CALL_LABELS = (NodeLabel.FUNCTION, NodeLabel.METHOD, NodeLabel.CLASS)
+_SYMBOLS_PER_FILE = 20
+_RESOLVE_CALLS = 1000
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _build_graph(symbol_count: int) -> KnowledgeGraph:
+    """Build a graph of *symbol_count* functions spread over many files.
+
+    Every tenth symbol name is shared across files so that resolution
+    exercises the same-file, import-resolved and global fallback paths.
+    """
+    g = KnowledgeGraph()
+    for i in range(symbol_count):
+        file_path = f"src/pkg{i // 500}/mod{i // _SYMBOLS_PER_FILE}.py"
+        file_id = generate_id(NodeLabel.FILE, file_path)
+        if i % _SYMBOLS_PER_FILE == 0:
+            g.add_node(
+                GraphNode(
+                    id=file_id,
+                    label=NodeLabel.FILE,
+                    name=file_path.rsplit("/", 1)[-1],
+                    file_path=file_path,
+                )
+            )
+
+        name = f"shared_{i % 10}" if i % 10 == 0 else f"func_{i}"
+        offset = i % _SYMBOLS_PER_FILE
+        node_id = generate_id(NodeLabel.FUNCTION, file_path, name)
+        g.add_node(
+            GraphNode(
+                id=node_id,
+                label=NodeLabel.FUNCTION,
+                name=name,
+                file_path=file_path,
+                start_line=offset * 10 + 1,
+                end_line=offset * 10 + 9,
+            )
+        )
+        g.add_relationship(
+            GraphRelationship(
+                id=f"defines:{file_id}->{node_id}",
+                type=RelType.DEFINES,
+                source=file_id,
+                target=node_id,
+            )
+        )
+    return g
+
+
+@pytest.fixture(scope="module", params=[10_000], ids=lambda n: f"n={n}")
+def big_graph(request: pytest.FixtureRequest) -> KnowledgeGraph:
+    return _build_graph(request.param)
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+
+def test_bench_build_index(benchmark, big_graph: KnowledgeGraph) -> None:
+    index = benchmark(build_name_index, big_graph, _CALL_LABELS)
+
+    assert sum(len(ids) for ids in index.values()) == big_graph.count_nodes_by_label(
+        NodeLabel.FUNCTION
+    )
+
+
+def test_bench_resolve_call(benchmark, big_graph: KnowledgeGraph) -> None:
+    index = build_name_index(big_graph, _CALL_LABELS)
+    calls = [
+        (
+            CallInfo(name="shared_0" if i % 2 else f"func_{i + 1}", line=5),
+            f"src/pkg0/mod{i % 25}.py",
+        )
+        for i in range(_RESOLVE_CALLS)
+    ]
+
+    def _resolve_all() -> int:
+        resolved = 0
+        for call, file_path in calls:
+            target_id, _ = resolve_call(call, file_path, index, big_graph)
+            if target_id is not None:
+                resolved += 1
+        return resolved
+
+    resolved = benchmark.pedantic(_resolve_all, rounds=5, iterations=1)
+
+    assert resolved > 0
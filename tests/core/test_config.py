@@ -8,6 +8,7 @@ import pytest
 
 from axon_pro.config.ignore import (
     DEFAULT_IGNORE_PATTERNS,
+    dir_is_ignored,
     load_gitignore,
     should_ignore,
 )
@@ -47,6 +48,10 @@ class TestShouldIgnore:
     def test_so_extension(self) -> None:
         assert should_ignore("lib/native.so") is True
 
+    def test_suffix_glob_matches_directory_component(self) -> None:
+        assert should_ignore("lib.so/x.py") is True
+        assert should_ignore("build/app.min.js/index.js") is True
+
     def test_min_js(self) -> None:
         assert should_ignore("static/app.min.js") is True
 
@@ -72,6 +77,23 @@ class TestShouldIgnore:
         assert should_ignore("tmp/cache", gitignore_patterns=patterns) is True
         assert should_ignore("src/main.py", gitignore_patterns=patterns) is False
 
+    def test_gitignore_negated_patterns(self) -> None:
+        patterns = ["*.log", "!keep.log", "build/"]
+        assert should_ignore("debug.log", gitignore_patterns=patterns) is True
+        assert should_ignore("logs/keep.log", gitignore_patterns=patterns) is False
+        assert should_ignore("src/build/out.js", gitignore_patterns=patterns) is True
+
+    def test_gitignore_literal_patterns(self) -> None:
+        patterns = ["secrets", "cache/", "/docs/api", "out/gen/"]
+        assert should_ignore("a/secrets", gitignore_patterns=patterns) is True
+        assert should_ignore("a/secrets/key.pem", gitignore_patterns=patterns) is True
+        assert should_ignore("a/cache", gitignore_patterns=patterns) is False
+        assert should_ignore("a/cache/x.py", gitignore_patterns=patterns) is True
+        assert should_ignore("docs/api/index.md", gitignore_patterns=patterns) is True
+        assert should_ignore("src/docs/api/index.md", gitignore_patterns=patterns) is False
+        assert should_ignore("out/gen", gitignore_patterns=patterns) is False
+        assert should_ignore("out/gen/x.py", gitignore_patterns=patterns) is True
+
     def test_gitignore_none_patterns(self) -> None:
         assert should_ignore("src/main.py", gitignore_patterns=None) is False
 
@@ -79,6 +101,24 @@ class TestShouldIgnore:
         assert should_ignore("src/main.py", gitignore_patterns=[]) is False
 
 
+class TestDirIsIgnored:
+    """Tests for dir_is_ignored()."""
+
+    def test_default_directory(self) -> None:
+        assert dir_is_ignored("node_modules") is True
+        assert dir_is_ignored("a/node_modules/pkg/lib") is True
+
+    def test_normal_directory(self) -> None:
+        assert dir_is_ignored("src/pkg") is False
+
+    def test_literal_gitignore_directory(self) -> None:
+        assert dir_is_ignored("out/gen/sub", ("out/gen/",)) is True
+        assert dir_is_ignored("src/out", ("out/gen/",)) is False
+
+    def test_negated_patterns_defer_to_file_check(self) -> None:
+        assert dir_is_ignored("vendor", ("vendor/", "!vendor/keep.py")) is False
+
+
 class TestLoadGitignore:
     """Tests for load_gitignore()."""
 
@@ -99,6 +139,11 @@ class TestLoadGitignore:
         patterns = load_gitignore(tmp_path)
         assert patterns == []
 
+    def test_repo_path_is_a_file(self, tmp_path: Path) -> None:
+        repo_file = tmp_path / "not_a_repo"
+        repo_file.write_text("", encoding="utf-8")
+        assert load_gitignore(repo_file) == []
+
     def test_empty_gitignore(self, tmp_path: Path) -> None:
         gitignore = tmp_path / ".gitignore"
         gitignore.write_text("", encoding="utf-8")
@@ -165,6 +210,11 @@ class TestGetLanguage:
     def test_no_extension(self) -> None:
         assert get_language("Makefile") is None
 
+    def test_bare_dotfile(self) -> None:
+        assert get_language(".py") is None
+        assert get_language("src/.ts") is None
+        assert is_supported(Path("src/.js")) is False
+
     def test_accepts_path_object(self) -> None:
         assert get_language(Path("src/app.py")) == "python"
 
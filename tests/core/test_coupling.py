@@ -11,6 +11,7 @@ from axon_pro.core.graph.model import GraphNode, NodeLabel, RelType, generate_id
 from axon_pro.core.ingestion.coupling import (
     build_cochange_matrix,
     calculate_coupling,
+    calculate_coupling_bulk,
     process_coupling,
 )
 
@@ -92,6 +93,22 @@ class TestBuildCochangeMatrix:
         matrix = build_cochange_matrix([], min_cochanges=1)
         assert matrix == {}
 
+    def test_build_cochange_matrix_long_history(self) -> None:
+        """Long histories (sparse path when scipy is available) count the same."""
+        paths = [f"src/mod{i}.py" for i in range(8)]
+        commits = [[paths[i % 8], paths[(i * 3) % 8], paths[(i + 5) % 8]] for i in range(200)]
+
+        expected: dict[tuple[str, str], int] = {}
+        for files in commits:
+            unique = sorted(set(files))
+            for i, a in enumerate(unique):
+                for b in unique[i + 1:]:
+                    expected[(a, b)] = expected.get((a, b), 0) + 1
+
+        matrix = build_cochange_matrix(commits, min_cochanges=1)
+        assert matrix == expected
+        assert all(isinstance(count, int) for count in matrix.values())
+
 
 # ---------------------------------------------------------------------------
 # calculate_coupling tests
@@ -119,6 +136,26 @@ class TestCalculateCoupling:
         # 6 / max(8, 8) = 6 / 8 = 0.75
         assert strength == pytest.approx(0.75)
 
+    def test_calculate_coupling_bulk_matches_scalar(self) -> None:
+        """The bulk variant returns the same strengths as the scalar function."""
+        total_changes = {"src/auth.py": 10, "src/models.py": 5, "src/views.py": 8}
+        pairs = [
+            ("src/auth.py", "src/models.py"),
+            ("src/models.py", "src/views.py"),
+            ("src/unknown.py", "src/other.py"),
+        ]
+        co_changes = [5, 6, 0]
+
+        strengths = calculate_coupling_bulk(pairs, co_changes, total_changes)
+
+        assert strengths == pytest.approx(
+            [
+                calculate_coupling(a, b, co, total_changes)
+                for (a, b), co in zip(pairs, co_changes)
+            ]
+        )
+        assert strengths[2] == 0.0
+
 
 # ---------------------------------------------------------------------------
 # process_coupling tests
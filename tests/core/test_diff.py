@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import copy
+import re
+
+import pytest
+
 from axon_pro.core.diff import StructuralDiff, diff_graphs, format_diff
 from axon_pro.core.graph.model import (
     GraphNode,
@@ -27,6 +32,15 @@ def _node(nid: str, label: NodeLabel = NodeLabel.FUNCTION, **kwargs) -> GraphNod
     )
 
 
+def _same(nid: str, **kwargs) -> tuple[dict[str, GraphNode], dict[str, GraphNode]]:
+    """Return base and current node maps sharing one :func:`_node` instance.
+
+    Relies on diff_graphs not mutating its input nodes.
+    """
+    node = _node(nid, **kwargs)
+    return {nid: node}, {nid: node}
+
+
 def _rel(rid: str, rel_type: RelType = RelType.CALLS, **kwargs) -> GraphRelationship:
     """Create a GraphRelationship with sensible defaults."""
     return GraphRelationship(
@@ -39,132 +53,92 @@ def _rel(rid: str, rel_type: RelType = RelType.CALLS, **kwargs) -> GraphRelation
 
 
 # ---------------------------------------------------------------------------
-# Tests: diff_graphs — node detection
-# ---------------------------------------------------------------------------
-
-
-class TestDiffGraphsAddedNodes:
-    """Nodes present in current but not base are detected as added."""
-
-    def test_added_nodes(self) -> None:
-        base = {}
-        current = {"n1": _node("n1")}
-
-        result = diff_graphs(base, current, {}, {})
-
-        assert len(result.added_nodes) == 1
-        assert result.added_nodes[0].id == "n1"
-        assert result.removed_nodes == []
-        assert result.modified_nodes == []
-
-
-class TestDiffGraphsRemovedNodes:
-    """Nodes present in base but not current are detected as removed."""
-
-    def test_removed_nodes(self) -> None:
-        base = {"n1": _node("n1")}
-        current = {}
-
-        result = diff_graphs(base, current, {}, {})
-
-        assert len(result.removed_nodes) == 1
-        assert result.removed_nodes[0].id == "n1"
-        assert result.added_nodes == []
-
-
-class TestDiffGraphsModifiedContent:
-    """Nodes with same ID but different content are detected as modified."""
-
-    def test_modified_content(self) -> None:
-        base = {"n1": _node("n1", content="old body")}
-        current = {"n1": _node("n1", content="new body")}
-
-        result = diff_graphs(base, current, {}, {})
-
-        assert len(result.modified_nodes) == 1
-        assert result.modified_nodes[0][0].content == "old body"
-        assert result.modified_nodes[0][1].content == "new body"
-        assert result.added_nodes == []
-        assert result.removed_nodes == []
-
-
-class TestDiffGraphsModifiedSignature:
-    """Nodes with same ID but different signature are detected as modified."""
-
-    def test_modified_signature(self) -> None:
-        base = {"n1": _node("n1", signature="def foo()")}
-        current = {"n1": _node("n1", signature="def foo(x: int)")}
-
-        result = diff_graphs(base, current, {}, {})
-
-        assert len(result.modified_nodes) == 1
-
-
-class TestDiffGraphsModifiedLines:
-    """Nodes with same ID but different line numbers are detected as modified."""
-
-    def test_modified_start_line(self) -> None:
-        base = {"n1": _node("n1", start_line=10, end_line=20)}
-        current = {"n1": _node("n1", start_line=15, end_line=25)}
-
-        result = diff_graphs(base, current, {}, {})
-
-        assert len(result.modified_nodes) == 1
-
-
-class TestDiffGraphsUnchangedNodes:
-    """Identical nodes produce no diff entries."""
-
-    def test_unchanged(self) -> None:
-        n = _node("n1", content="body", signature="def f()")
-        base = {"n1": n}
-        current = {"n1": n}
-
-        result = diff_graphs(base, current, {}, {})
-
-        assert result.added_nodes == []
-        assert result.removed_nodes == []
-        assert result.modified_nodes == []
-
-
-class TestDiffGraphsEmptyGraphs:
-    """Diffing two empty graphs produces an empty diff."""
-
-    def test_empty(self) -> None:
-        result = diff_graphs({}, {}, {}, {})
-
-        assert result == StructuralDiff()
-
-
-# ---------------------------------------------------------------------------
-# Tests: diff_graphs — relationship detection
+# Tests: diff_graphs — single-change cases
 # ---------------------------------------------------------------------------
 
+# (id, base_nodes, current_nodes, base_rels, current_rels, expected) where
+# expected lists the ids of the added, removed, and modified nodes, then of
+# the added and removed relationships.
+_DIFF_CASES = [
+    ("added_node", {}, {"n1": _node("n1")}, {}, {}, (["n1"], [], [], [], [])),
+    ("removed_node", {"n1": _node("n1")}, {}, {}, {}, ([], ["n1"], [], [], [])),
+    (
+        "modified_content",
+        {"n1": _node("n1", content="old body")},
+        {"n1": _node("n1", content="new body")},
+        {},
+        {},
+        ([], [], ["n1"], [], []),
+    ),
+    (
+        "modified_signature",
+        {"n1": _node("n1", signature="def foo()")},
+        {"n1": _node("n1", signature="def foo(x: int)")},
+        {},
+        {},
+        ([], [], ["n1"], [], []),
+    ),
+    (
+        "modified_lines",
+        {"n1": _node("n1", start_line=10, end_line=20)},
+        {"n1": _node("n1", start_line=15, end_line=25)},
+        {},
+        {},
+        ([], [], ["n1"], [], []),
+    ),
+    (
+        "unchanged",
+        *_same("n1", content="body", signature="def f()"),
+        {},
+        {},
+        ([], [], [], [], []),
+    ),
+    ("empty", {}, {}, {}, {}, ([], [], [], [], [])),
+    ("added_rel", {}, {}, {}, {"r1": _rel("r1")}, ([], [], [], ["r1"], [])),
+    ("removed_rel", {}, {}, {"r1": _rel("r1")}, {}, ([], [], [], [], ["r1"])),
+]
+
+
+class TestDiffGraphsCases:
+    """Each kind of change is detected on its own."""
+
+    @pytest.mark.parametrize(
+        ("base_nodes", "current_nodes", "base_rels", "current_rels", "expected"),
+        [case[1:] for case in _DIFF_CASES],
+        ids=[case[0] for case in _DIFF_CASES],
+    )
+    def test_diff_cases(
+        self,
+        base_nodes: dict,
+        current_nodes: dict,
+        base_rels: dict,
+        current_rels: dict,
+        expected: tuple[list[str], ...],
+    ) -> None:
+        """Only the expected ids appear; modified pairs are the input objects."""
+        result = diff_graphs(base_nodes, current_nodes, base_rels, current_rels)
 
-class TestDiffGraphsAddedRelationships:
-    """Relationships in current but not base are added."""
-
-    def test_added_rels(self) -> None:
-        base_rels: dict[str, GraphRelationship] = {}
-        current_rels = {"r1": _rel("r1")}
-
-        result = diff_graphs({}, {}, base_rels, current_rels)
-
-        assert len(result.added_relationships) == 1
-        assert result.added_relationships[0].id == "r1"
-
-
-class TestDiffGraphsRemovedRelationships:
-    """Relationships in base but not current are removed."""
+        assert (
+            [n.id for n in result.added_nodes],
+            [n.id for n in result.removed_nodes],
+            [base.id for base, _ in result.modified_nodes],
+            [r.id for r in result.added_relationships],
+            [r.id for r in result.removed_relationships],
+        ) == expected
+        for base, current in result.modified_nodes:
+            assert base is base_nodes[base.id]
+            assert current is current_nodes[current.id]
 
-    def test_removed_rels(self) -> None:
-        base_rels = {"r1": _rel("r1")}
-        current_rels: dict[str, GraphRelationship] = {}
+    def test_does_not_mutate_shared_inputs(self) -> None:
+        base, current = _same("n1", content="body", signature="def f()")
+        rel = _rel("r1")
+        rel_snapshot = copy.deepcopy(rel)
 
-        result = diff_graphs({}, {}, base_rels, current_rels)
+        diff_graphs(base, current, {"r1": rel}, {"r1": rel})
 
-        assert len(result.removed_relationships) == 1
-        assert result.removed_relationships[0].id == "r1"
+        assert current["n1"].content == "body"
+        assert current["n1"].signature == "def f()"
+        assert rel == rel_snapshot
 
 
 # ---------------------------------------------------------------------------
@@ -217,6 +191,36 @@ class TestDiffGraphsMixedChanges:
 # Tests: format_diff
 # ---------------------------------------------------------------------------
 
+# format_diff is pure, so the sample diffs are built once and shared.
+_SAMPLE_ADDED = StructuralDiff(added_nodes=[_node("n1", name="my_func")])
+_SAMPLE_REMOVED = StructuralDiff(removed_nodes=[_node("n1", name="old_func")])
+_SAMPLE_MODIFIED = StructuralDiff(
+    modified_nodes=[(_node("n1", name="changed_func"), _node("n1", name="changed_func"))]
+)
+_SAMPLE_RELS = StructuralDiff(
+    added_relationships=[_rel("r1", source="func:a:f", target="func:b:g")],
+    removed_relationships=[_rel("r2", source="func:c:h", target="func:d:i")],
+)
+_SAMPLE_FULL = StructuralDiff(
+    added_nodes=[_node("n1")],
+    removed_nodes=[_node("n2")],
+    modified_nodes=[(_node("n3"), _node("n3"))],
+)
+
+# Each pattern checks the whole expected shape of one sample in a single scan.
+_ADDED_RE = re.compile(r"1 changes.*Added nodes \(1\):\n  \+ my_func ", re.DOTALL)
+_REMOVED_RE = re.compile(r"Removed nodes \(1\):\n  - old_func ")
+_MODIFIED_RE = re.compile(r"Modified nodes \(1\):\n  ~ changed_func ")
+_RELS_RE = re.compile(
+    r"Added relationships \(1\):\n  \+ \[calls\] func:a:f -> func:b:g"
+    r".*Removed relationships \(1\):\n  - \[calls\] func:c:h -> func:d:i",
+    re.DOTALL,
+)
+_SUMMARY_RE = re.compile(
+    r"3 changes.*Added nodes \(1\).*Removed nodes \(1\).*Modified nodes \(1\)",
+    re.DOTALL,
+)
+
 
 class TestFormatDiffEmpty:
     """Empty diff produces a 'no differences' message."""
@@ -230,64 +234,55 @@ class TestFormatDiffAddedNodes:
     """Added nodes appear with + prefix."""
 
     def test_added(self) -> None:
-        diff = StructuralDiff(added_nodes=[_node("n1", name="my_func")])
-        result = format_diff(diff)
+        result = format_diff(_SAMPLE_ADDED)
 
-        assert "+ my_func" in result
-        assert "Added nodes (1)" in result
-        assert "1 changes" in result
+        assert _ADDED_RE.search(result), result
 
 
 class TestFormatDiffRemovedNodes:
     """Removed nodes appear with - prefix."""
 
     def test_removed(self) -> None:
-        diff = StructuralDiff(removed_nodes=[_node("n1", name="old_func")])
-        result = format_diff(diff)
+        result = format_diff(_SAMPLE_REMOVED)
 
-        assert "- old_func" in result
-        assert "Removed nodes (1)" in result
+        assert _REMOVED_RE.search(result), result
 
 
 class TestFormatDiffModifiedNodes:
     """Modified nodes appear with ~ prefix."""
 
     def test_modified(self) -> None:
-        diff = StructuralDiff(
-            modified_nodes=[
-                (_node("n1", name="changed_func"), _node("n1", name="changed_func"))
-            ]
-        )
-        result = format_diff(diff)
+        result = format_diff(_SAMPLE_MODIFIED)
 
-        assert "~ changed_func" in result
-        assert "Modified nodes (1)" in result
+        assert _MODIFIED_RE.search(result), result
 
 
 class TestFormatDiffRelationships:
     """Relationship changes include type and source->target."""
 
     def test_rel_format(self) -> None:
-        diff = StructuralDiff(
-            added_relationships=[_rel("r1", source="func:a:f", target="func:b:g")],
-            removed_relationships=[_rel("r2", source="func:c:h", target="func:d:i")],
-        )
-        result = format_diff(diff)
+        result = format_diff(_SAMPLE_RELS)
 
-        assert "Added relationships (1)" in result
-        assert "Removed relationships (1)" in result
-        assert "[calls]" in result
+        assert _RELS_RE.search(result), result
 
 
 class TestFormatDiffFullSummary:
     """The summary line shows total change count."""
 
     def test_summary(self) -> None:
-        diff = StructuralDiff(
-            added_nodes=[_node("n1")],
-            removed_nodes=[_node("n2")],
-            modified_nodes=[(_node("n3"), _node("n3"))],
-        )
-        result = format_diff(diff)
-
-        assert "3 changes" in result
+        result = format_diff(_SAMPLE_FULL)
+
+        assert _SUMMARY_RE.search(result), result
+
+
+class TestFormatDiffPurity:
+    """format_diff neither mutates its input nor depends on call history."""
+
+    def test_repeatable(self) -> None:
+        samples = (_SAMPLE_ADDED, _SAMPLE_REMOVED, _SAMPLE_MODIFIED, _SAMPLE_RELS, _SAMPLE_FULL)
+        for sample in samples:
+            snapshot = copy.deepcopy(sample)
+            first = format_diff(sample)
+
+            assert format_diff(sample) == first
+            assert sample == snapshot
@@ -7,27 +7,92 @@ Verifies that ``embed_graph`` correctly:
 - Returns properly structured ``NodeEmbedding`` objects
 - Handles edge cases: empty graphs, custom model names, batch sizes
 
-IMPORTANT: All tests mock ``TextEmbedding`` to avoid slow model downloads.
+IMPORTANT: All tests patch ``_get_model`` to avoid slow model downloads.
 """
 
 from __future__ import annotations
 
+import copy
+from collections.abc import Iterable, Iterator
+from itertools import islice, repeat
+from typing import NamedTuple
+from unittest.mock import MagicMock, patch
+from weakref import WeakKeyDictionary
+
 import numpy as np
 import pytest
-from unittest.mock import MagicMock, call, patch
 
-from axon_pro.core.embeddings.embedder import embed_graph, EMBEDDABLE_LABELS, _get_model
+from axon_pro.core.embeddings import embedder, text
+from axon_pro.core.embeddings.embedder import embed_graph, EMBEDDABLE_LABELS
 from axon_pro.core.graph.graph import KnowledgeGraph
 from axon_pro.core.graph.model import GraphNode, NodeLabel
 from axon_pro.core.storage.base import NodeEmbedding
 
 
+# Safe to run under ``pytest -n auto --dist loadgroup``: every patch is
+# function-local, and grouping keeps this module's tests on one worker.
+pytestmark = pytest.mark.xdist_group(name="embedder_tests")
+
+
+# Nodes for the large-graph test, built once; GraphNode instances are only
+# read by embed_graph, so every graph can share them.
+_MANY_NODES = [
+    GraphNode(
+        id=f"function:src/mod.py:fn_{i}",
+        label=NodeLabel.FUNCTION,
+        name=f"fn_{i}",
+        file_path="src/mod.py",
+    )
+    for i in range(100)
+]
+
+
+class _EmbedCall(NamedTuple):
+    texts: list[str]
+    batch_size: int | None
+
+
+class _FakeModel:
+    """Hand-written stand-in for fastembed's ``TextEmbedding``.
+
+    ``embed`` records each call and yields the first ``len(texts)`` entries
+    of :attr:`vectors` (any iterable), as the real model yields one vector
+    per text.
+    """
+
+    def __init__(self, vectors: Iterable[np.ndarray]) -> None:
+        self.vectors = vectors
+        self.model_names: list[str] = []
+        self.embed_calls: list[_EmbedCall] = []
+
+    def embed(
+        self,
+        documents: Iterable[str],
+        batch_size: int | None = None,
+    ) -> Iterator[np.ndarray]:
+        texts = list(documents)
+        self.embed_calls.append(_EmbedCall(texts, batch_size))
+        return islice(self.vectors, len(texts))
+
+
 @pytest.fixture(autouse=True)
-def _clear_model_cache():
-    """Clear the lru_cache on _get_model before each test so mocks work."""
-    _get_model.cache_clear()
-    yield
-    _get_model.cache_clear()
+def fake_model(monkeypatch: pytest.MonkeyPatch, vec_pool: np.ndarray) -> _FakeModel:
+    """Replace ``_get_model`` for every test in this module.
+
+    Patching the loader itself bypasses its lru_cache, so no cache clearing
+    is needed between tests.  The loader records the requested model names
+    on the returned fake.
+    """
+    model = _FakeModel(vec_pool)
+
+    def _get_model(model_name: str) -> _FakeModel:
+        model.model_names.append(model_name)
+        return model
+
+    monkeypatch.setattr(embedder, "_get_model", _get_model)
+    # The graph fixtures are shared, so start every test with no cached texts.
+    monkeypatch.setattr(text, "_text_cache", WeakKeyDictionary())
+    return model
 
 
 # ---------------------------------------------------------------------------
@@ -35,37 +100,40 @@ def _clear_model_cache():
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+# The graph fixtures are module-scoped: embed_graph only reads the graph, so
+# every test can share one instance.  A test that needs to mutate a graph
+# should deep-copy the fixture first.
+
+
+@pytest.fixture(scope="module")
 def sample_graph() -> KnowledgeGraph:
     """Graph with two embeddable nodes (function, class) and one non-embeddable (folder)."""
     graph = KnowledgeGraph()
-    graph.add_node(
-        GraphNode(
-            id="function:src/a.py:foo",
-            label=NodeLabel.FUNCTION,
-            name="foo",
-            file_path="src/a.py",
-        )
-    )
-    graph.add_node(
-        GraphNode(
-            id="class:src/a.py:Bar",
-            label=NodeLabel.CLASS,
-            name="Bar",
-            file_path="src/a.py",
-        )
-    )
-    graph.add_node(
-        GraphNode(
-            id="folder::src",
-            label=NodeLabel.FOLDER,
-            name="src",
-        )
+    graph.add_nodes(
+        [
+            GraphNode(
+                id="function:src/a.py:foo",
+                label=NodeLabel.FUNCTION,
+                name="foo",
+                file_path="src/a.py",
+            ),
+            GraphNode(
+                id="class:src/a.py:Bar",
+                label=NodeLabel.CLASS,
+                name="Bar",
+                file_path="src/a.py",
+            ),
+            GraphNode(
+                id="folder::src",
+                label=NodeLabel.FOLDER,
+                name="src",
+            ),
+        ]
     )
     return graph
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def all_label_graph() -> KnowledgeGraph:
     """Graph containing one node of every label for completeness testing."""
     graph = KnowledgeGraph()
@@ -113,8 +181,7 @@ def all_label_graph() -> KnowledgeGraph:
         GraphNode(id="community::auth", label=NodeLabel.COMMUNITY, name="auth"),
         GraphNode(id="process::login", label=NodeLabel.PROCESS, name="login"),
     ]
-    for n in nodes:
-        graph.add_node(n)
+    graph.add_nodes(nodes)
     return graph
 
 
@@ -126,8 +193,10 @@ def all_label_graph() -> KnowledgeGraph:
 class TestEmbeddableLabels:
     """Verify the EMBEDDABLE_LABELS constant."""
 
-    def test_contains_expected_labels(self) -> None:
-        expected = {
+    def test_embeddable_labels(self) -> None:
+        """A frozenset of the code-symbol labels, excluding structural ones."""
+        assert isinstance(EMBEDDABLE_LABELS, frozenset)
+        assert EMBEDDABLE_LABELS == {
             NodeLabel.FILE,
             NodeLabel.FUNCTION,
             NodeLabel.CLASS,
@@ -136,15 +205,9 @@ class TestEmbeddableLabels:
             NodeLabel.TYPE_ALIAS,
             NodeLabel.ENUM,
         }
-        assert EMBEDDABLE_LABELS == expected
-
-    def test_excludes_structural_labels(self) -> None:
-        assert NodeLabel.FOLDER not in EMBEDDABLE_LABELS
-        assert NodeLabel.COMMUNITY not in EMBEDDABLE_LABELS
-        assert NodeLabel.PROCESS not in EMBEDDABLE_LABELS
-
-    def test_is_frozenset(self) -> None:
-        assert isinstance(EMBEDDABLE_LABELS, frozenset)
+        assert EMBEDDABLE_LABELS.isdisjoint(
+            {NodeLabel.FOLDER, NodeLabel.COMMUNITY, NodeLabel.PROCESS}
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -155,71 +218,28 @@ class TestEmbeddableLabels:
 class TestEmbedGraphBasic:
     """Core functionality of embed_graph."""
 
-    @patch("fastembed.TextEmbedding")
-    def test_returns_node_embeddings(self, mock_te_cls: MagicMock, sample_graph: KnowledgeGraph) -> None:
-        """embed_graph returns a list of NodeEmbedding objects for embeddable nodes."""
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.5, 0.6])]
-        )
-        mock_te_cls.return_value = mock_model
-
+    def test_returns_node_embeddings(
+        self, sample_graph: KnowledgeGraph, vec_pool: np.ndarray
+    ) -> None:
+        """One embed_graph call checked for count, types, values, and node IDs."""
         results = embed_graph(sample_graph)
 
-        assert len(results) == 2  # function + class; folder is skipped
+        # One NodeEmbedding per embeddable node; the folder is skipped.
+        assert len(results) == 2
         assert all(isinstance(r, NodeEmbedding) for r in results)
 
-    @patch("fastembed.TextEmbedding")
-    def test_embedding_vectors_are_lists_of_float(
-        self, mock_te_cls: MagicMock, sample_graph: KnowledgeGraph
-    ) -> None:
-        """Embedding vectors are plain Python lists, not numpy arrays."""
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.5, 0.6])]
-        )
-        mock_te_cls.return_value = mock_model
-
-        results = embed_graph(sample_graph)
-
+        # The model's float32 vectors are passed through without a list copy.
         for r in results:
-            assert isinstance(r.embedding, list)
-            assert all(isinstance(v, float) for v in r.embedding)
-
-    @patch("fastembed.TextEmbedding")
-    def test_embedding_values_match(
-        self, mock_te_cls: MagicMock, sample_graph: KnowledgeGraph
-    ) -> None:
-        """Embedding values from the model are correctly mapped to NodeEmbedding objects."""
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.5, 0.6])]
-        )
-        mock_te_cls.return_value = mock_model
-
-        results = embed_graph(sample_graph)
+            assert isinstance(r.embedding, np.ndarray)
+            assert r.embedding.dtype == np.float32
+            assert r.embedding.shape == (3,)
 
-        # We should get two results with the two mock vectors
-        embeddings = [r.embedding for r in results]
-        assert [0.1, 0.2, 0.3] in embeddings or pytest.approx([0.1, 0.2, 0.3]) in embeddings
-        assert [0.4, 0.5, 0.6] in embeddings or pytest.approx([0.4, 0.5, 0.6]) in embeddings
-
-    @patch("fastembed.TextEmbedding")
-    def test_node_ids_are_correct(
-        self, mock_te_cls: MagicMock, sample_graph: KnowledgeGraph
-    ) -> None:
-        """NodeEmbedding objects carry the correct node IDs."""
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.5, 0.6])]
-        )
-        mock_te_cls.return_value = mock_model
-
-        results = embed_graph(sample_graph)
+        # Model vectors are mapped onto the NodeEmbedding objects in node order.
+        assert np.array_equal(np.stack([r.embedding for r in results]), vec_pool[:2])
 
+        # NodeEmbedding objects carry the correct node IDs.
         node_ids = {r.node_id for r in results}
-        assert "function:src/a.py:foo" in node_ids
-        assert "class:src/a.py:Bar" in node_ids
+        assert node_ids == {"function:src/a.py:foo", "class:src/a.py:Bar"}
 
 
 # ---------------------------------------------------------------------------
@@ -230,64 +250,35 @@ class TestEmbedGraphBasic:
 class TestEmbedGraphFiltering:
     """Filtering of non-embeddable nodes."""
 
-    @patch("fastembed.TextEmbedding")
-    def test_skips_folder_nodes(
-        self, mock_te_cls: MagicMock, sample_graph: KnowledgeGraph
-    ) -> None:
+    def test_skips_folder_nodes(self, sample_graph: KnowledgeGraph) -> None:
         """Folder nodes are excluded from embedding."""
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.5, 0.6])]
-        )
-        mock_te_cls.return_value = mock_model
-
         results = embed_graph(sample_graph)
 
         node_ids = {r.node_id for r in results}
         assert "folder::src" not in node_ids
 
-    @patch("fastembed.TextEmbedding")
     def test_skips_community_and_process(
-        self, mock_te_cls: MagicMock, all_label_graph: KnowledgeGraph
+        self,
+        fake_model: _FakeModel,
+        all_label_graph: KnowledgeGraph,
+        vec_pool: np.ndarray,
     ) -> None:
-        """Community and Process nodes are excluded from embedding."""
+        """Community and Process nodes are skipped; every embeddable label is kept."""
         embeddable_count = 7  # FILE, FUNCTION, CLASS, METHOD, INTERFACE, TYPE_ALIAS, ENUM
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]) for _ in range(embeddable_count)]
-        )
-        mock_te_cls.return_value = mock_model
+        fake_model.vectors = repeat(vec_pool[0], embeddable_count)
 
         results = embed_graph(all_label_graph)
 
         assert len(results) == embeddable_count
-        node_ids = {r.node_id for r in results}
-        assert "folder::src" not in node_ids
-        assert "community::auth" not in node_ids
-        assert "process::login" not in node_ids
-
-    @patch("fastembed.TextEmbedding")
-    def test_all_embeddable_labels_included(
-        self, mock_te_cls: MagicMock, all_label_graph: KnowledgeGraph
-    ) -> None:
-        """All embeddable label types produce NodeEmbedding objects."""
-        embeddable_count = 7
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]) for _ in range(embeddable_count)]
-        )
-        mock_te_cls.return_value = mock_model
-
-        results = embed_graph(all_label_graph)
-
-        node_ids = {r.node_id for r in results}
-        assert "file:src/a.py:" in node_ids
-        assert "function:src/a.py:foo" in node_ids
-        assert "class:src/a.py:Bar" in node_ids
-        assert "method:src/a.py:baz" in node_ids
-        assert "interface:src/types.ts:IFoo" in node_ids
-        assert "type_alias:src/types.py:UserID" in node_ids
-        assert "enum:src/enums.py:Color" in node_ids
+        assert {r.node_id for r in results} == {
+            "file:src/a.py:",
+            "function:src/a.py:foo",
+            "class:src/a.py:Bar",
+            "method:src/a.py:baz",
+            "interface:src/types.ts:IFoo",
+            "type_alias:src/types.py:UserID",
+            "enum:src/enums.py:Color",
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -298,25 +289,15 @@ class TestEmbedGraphFiltering:
 class TestEmbedGraphEmpty:
     """Edge case: empty graph."""
 
-    @patch("fastembed.TextEmbedding")
-    def test_empty_graph_returns_empty_list(self, mock_te_cls: MagicMock) -> None:
+    def test_empty_graph_returns_empty_list(self) -> None:
         """An empty graph produces no embeddings."""
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter([])
-        mock_te_cls.return_value = mock_model
-
         graph = KnowledgeGraph()
         results = embed_graph(graph)
 
         assert results == []
 
-    @patch("fastembed.TextEmbedding")
-    def test_graph_with_only_non_embeddable_returns_empty(self, mock_te_cls: MagicMock) -> None:
+    def test_graph_with_only_non_embeddable_returns_empty(self) -> None:
         """A graph containing only non-embeddable nodes returns an empty list."""
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter([])
-        mock_te_cls.return_value = mock_model
-
         graph = KnowledgeGraph()
         graph.add_node(
             GraphNode(id="folder::src", label=NodeLabel.FOLDER, name="src")
@@ -338,50 +319,30 @@ class TestEmbedGraphEmpty:
 class TestEmbedGraphModelConfig:
     """Model name and batch size configuration."""
 
-    @patch("fastembed.TextEmbedding")
-    def test_default_model_name(self, mock_te_cls: MagicMock, sample_graph: KnowledgeGraph) -> None:
+    def test_default_model_name(
+        self, fake_model: _FakeModel, sample_graph: KnowledgeGraph
+    ) -> None:
         """Default model is BAAI/bge-small-en-v1.5."""
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.5, 0.6])]
-        )
-        mock_te_cls.return_value = mock_model
-
         embed_graph(sample_graph)
 
-        mock_te_cls.assert_called_once_with(model_name="BAAI/bge-small-en-v1.5")
-
-    @patch("fastembed.TextEmbedding")
-    def test_custom_model_name(self, mock_te_cls: MagicMock, sample_graph: KnowledgeGraph) -> None:
-        """A custom model name is forwarded to TextEmbedding."""
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.5, 0.6])]
-        )
-        mock_te_cls.return_value = mock_model
+        assert fake_model.model_names == ["BAAI/bge-small-en-v1.5"]
 
+    def test_custom_model_name(
+        self, fake_model: _FakeModel, sample_graph: KnowledgeGraph
+    ) -> None:
+        """A custom model name is forwarded to the model loader."""
         embed_graph(sample_graph, model_name="BAAI/bge-base-en-v1.5")
 
-        mock_te_cls.assert_called_once_with(model_name="BAAI/bge-base-en-v1.5")
+        assert fake_model.model_names == ["BAAI/bge-base-en-v1.5"]
 
-    @patch("fastembed.TextEmbedding")
     def test_custom_batch_size_passed_to_embed(
-        self, mock_te_cls: MagicMock, sample_graph: KnowledgeGraph
+        self, fake_model: _FakeModel, sample_graph: KnowledgeGraph
     ) -> None:
         """The batch_size parameter is forwarded to model.embed()."""
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.5, 0.6])]
-        )
-        mock_te_cls.return_value = mock_model
-
         embed_graph(sample_graph, batch_size=32)
 
-        # Verify batch_size was passed to embed()
-        embed_call = mock_model.embed.call_args
-        assert embed_call.kwargs.get("batch_size") == 32 or (
-            len(embed_call.args) > 1 and embed_call.args[1] == 32
-        )
+        [call] = fake_model.embed_calls
+        assert call.batch_size == 32
 
 
 # ---------------------------------------------------------------------------
@@ -393,20 +354,13 @@ class TestEmbedGraphTextGeneration:
     """Verifies generate_text is called for each embeddable node."""
 
     @patch("axon_pro.core.embeddings.embedder.generate_text")
-    @patch("fastembed.TextEmbedding")
     def test_generate_text_called_for_each_node(
         self,
-        mock_te_cls: MagicMock,
         mock_gen_text: MagicMock,
         sample_graph: KnowledgeGraph,
     ) -> None:
         """generate_text is called once per embeddable node."""
         mock_gen_text.return_value = "mock text"
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.5, 0.6])]
-        )
-        mock_te_cls.return_value = mock_model
 
         embed_graph(sample_graph)
 
@@ -414,28 +368,47 @@ class TestEmbedGraphTextGeneration:
         assert mock_gen_text.call_count == 2
 
     @patch("axon_pro.core.embeddings.embedder.generate_text")
-    @patch("fastembed.TextEmbedding")
     def test_generated_texts_passed_to_model(
         self,
-        mock_te_cls: MagicMock,
         mock_gen_text: MagicMock,
+        fake_model: _FakeModel,
         sample_graph: KnowledgeGraph,
     ) -> None:
         """Texts from generate_text are forwarded to model.embed()."""
         mock_gen_text.side_effect = ["text for foo", "text for Bar"]
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.5, 0.6])]
-        )
-        mock_te_cls.return_value = mock_model
 
         embed_graph(sample_graph)
 
         # The texts list passed to model.embed should contain both texts
-        embed_call_args = mock_model.embed.call_args
-        texts_arg = embed_call_args.args[0] if embed_call_args.args else embed_call_args.kwargs.get("documents", [])
-        assert "text for foo" in texts_arg
-        assert "text for Bar" in texts_arg
+        [call] = fake_model.embed_calls
+        assert "text for foo" in call.texts
+        assert "text for Bar" in call.texts
+
+    @patch("axon_pro.core.embeddings.text._build_text", wraps=text._build_text)
+    def test_rerun_reuses_generated_texts(
+        self, mock_build_text: MagicMock, sample_graph: KnowledgeGraph
+    ) -> None:
+        """Re-embedding an unchanged graph does not regenerate any text."""
+        graph = copy.deepcopy(sample_graph)
+
+        first = embed_graph(graph)
+        second = embed_graph(graph)
+
+        assert mock_build_text.call_count == 2
+        assert [r.node_id for r in second] == [r.node_id for r in first]
+
+        # Any mutation invalidates the cache for that graph.
+        graph.add_node(
+            GraphNode(
+                id="function:src/b.py:qux",
+                label=NodeLabel.FUNCTION,
+                name="qux",
+                file_path="src/b.py",
+            )
+        )
+        embed_graph(graph)
+
+        assert mock_build_text.call_count == 5
 
 
 # ---------------------------------------------------------------------------
@@ -446,26 +419,11 @@ class TestEmbedGraphTextGeneration:
 class TestEmbedGraphBatchProcessing:
     """Verifies batch processing behaviour with larger graphs."""
 
-    @patch("fastembed.TextEmbedding")
-    def test_many_nodes_all_embedded(self, mock_te_cls: MagicMock) -> None:
+    @pytest.mark.parametrize("count", [10, pytest.param(100, marks=pytest.mark.slow)])
+    def test_many_nodes_all_embedded(self, fake_model: _FakeModel, count: int) -> None:
         """A graph with many embeddable nodes produces one embedding per node."""
         graph = KnowledgeGraph()
-        count = 100
-        for i in range(count):
-            graph.add_node(
-                GraphNode(
-                    id=f"function:src/mod.py:fn_{i}",
-                    label=NodeLabel.FUNCTION,
-                    name=f"fn_{i}",
-                    file_path="src/mod.py",
-                )
-            )
-
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([float(i), float(i + 1), float(i + 2)]) for i in range(count)]
-        )
-        mock_te_cls.return_value = mock_model
+        graph.add_nodes(_MANY_NODES[:count])
 
         results = embed_graph(graph, batch_size=16)
 
@@ -473,18 +431,21 @@ class TestEmbedGraphBatchProcessing:
         # Each embedding should have 3 dimensions
         assert all(len(r.embedding) == 3 for r in results)
 
-    @patch("fastembed.TextEmbedding")
-    def test_default_batch_size_is_64(self, mock_te_cls: MagicMock, sample_graph: KnowledgeGraph) -> None:
+    def test_default_batch_size_is_64(
+        self, fake_model: _FakeModel, sample_graph: KnowledgeGraph
+    ) -> None:
         """When batch_size is not specified, 64 is used by default."""
-        mock_model = MagicMock()
-        mock_model.embed.return_value = iter(
-            [np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.5, 0.6])]
-        )
-        mock_te_cls.return_value = mock_model
-
         embed_graph(sample_graph)
 
-        embed_call = mock_model.embed.call_args
-        assert embed_call.kwargs.get("batch_size") == 64 or (
-            len(embed_call.args) > 1 and embed_call.args[1] == 64
-        )
+        [call] = fake_model.embed_calls
+        assert call.batch_size == 64
+
+    def test_all_texts_in_single_embed_call(self, fake_model: _FakeModel) -> None:
+        """All texts go to one model.embed() call, regardless of batch_size."""
+        graph = KnowledgeGraph()
+        graph.add_nodes(_MANY_NODES[:10])
+
+        embed_graph(graph, batch_size=4)
+
+        [call] = fake_model.embed_calls
+        assert len(call.texts) == 10
@@ -17,7 +17,24 @@ from axon_pro.core.graph.model import (
     RelType,
     generate_id,
 )
-from axon_pro.core.embeddings.text import generate_text
+from axon_pro.core.embeddings.text import build_class_method_index, generate_text
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def _shared_graph() -> KnowledgeGraph:
+    return KnowledgeGraph()
+
+
+@pytest.fixture()
+def graph(_shared_graph: KnowledgeGraph) -> KnowledgeGraph:
+    """Return an empty graph; one instance is reset and reused per module."""
+    _shared_graph.reset()
+    return _shared_graph
 
 
 # ---------------------------------------------------------------------------
@@ -74,9 +91,8 @@ def _add(graph: KnowledgeGraph, *nodes: GraphNode) -> None:
 class TestFunctionText:
     """generate_text for FUNCTION nodes."""
 
-    def test_function_basic_info(self) -> None:
+    def test_function_basic_info(self, graph: KnowledgeGraph) -> None:
         """Text includes name, file path, and signature."""
-        graph = KnowledgeGraph()
         fn = _node(
             NodeLabel.FUNCTION,
             "validate_user",
@@ -91,9 +107,8 @@ class TestFunctionText:
         assert "src/auth.py" in text
         assert "def validate_user(user: User) -> bool" in text
 
-    def test_function_with_calls(self) -> None:
+    def test_function_with_calls(self, graph: KnowledgeGraph) -> None:
         """Text lists callees (outgoing CALLS) and callers (incoming CALLS)."""
-        graph = KnowledgeGraph()
         fn = _node(NodeLabel.FUNCTION, "validate_user", file_path="src/auth.py")
         callee1 = _node(NodeLabel.FUNCTION, "check_password", file_path="src/auth.py")
         callee2 = _node(NodeLabel.FUNCTION, "load_user", file_path="src/db.py")
@@ -114,9 +129,8 @@ class TestFunctionText:
         assert "called by:" in text.lower() or "called by:" in text
         assert "login_handler" in text
 
-    def test_function_with_uses_type(self) -> None:
+    def test_function_with_uses_type(self, graph: KnowledgeGraph) -> None:
         """Text lists types referenced via USES_TYPE edges."""
-        graph = KnowledgeGraph()
         fn = _node(NodeLabel.FUNCTION, "validate_user", file_path="src/auth.py")
         type_node = _node(NodeLabel.CLASS, "User", file_path="src/models.py")
         _add(graph, fn, type_node)
@@ -132,9 +146,8 @@ class TestFunctionText:
 class TestMethodText:
     """generate_text for METHOD nodes."""
 
-    def test_method_includes_class_name(self) -> None:
+    def test_method_includes_class_name(self, graph: KnowledgeGraph) -> None:
         """Text includes the class it belongs to."""
-        graph = KnowledgeGraph()
         method = _node(
             NodeLabel.METHOD,
             "get_name",
@@ -160,9 +173,8 @@ class TestMethodText:
 class TestClassText:
     """generate_text for CLASS nodes."""
 
-    def test_class_basic_info(self) -> None:
+    def test_class_basic_info(self, graph: KnowledgeGraph) -> None:
         """Text includes name and file path."""
-        graph = KnowledgeGraph()
         cls = _node(NodeLabel.CLASS, "UserService", file_path="src/services.py")
         graph.add_node(cls)
 
@@ -171,9 +183,8 @@ class TestClassText:
         assert "class UserService" in text
         assert "src/services.py" in text
 
-    def test_class_with_methods(self) -> None:
+    def test_class_with_methods(self, graph: KnowledgeGraph) -> None:
         """Text lists methods that belong to the class (class_name match)."""
-        graph = KnowledgeGraph()
         cls = _node(NodeLabel.CLASS, "UserService", file_path="src/services.py")
         m1 = _node(
             NodeLabel.METHOD,
@@ -202,9 +213,35 @@ class TestClassText:
         assert "delete_user" in text
         assert "other_method" not in text
 
-    def test_class_with_extends_and_implements(self) -> None:
+    def test_class_methods_split_across_files(self, graph: KnowledgeGraph) -> None:
+        """Methods in the class's own file and in other parts are all listed."""
+        cls = _node(NodeLabel.CLASS, "Foo", file_path="src/Foo.cs")
+        own = _node(NodeLabel.METHOD, "A", file_path="src/Foo.cs", class_name="Foo")
+        part = _node(NodeLabel.METHOD, "B", file_path="src/Foo.Part.cs", class_name="Foo")
+        _add(graph, cls, own, part)
+
+        text = generate_text(cls, graph)
+
+        assert "methods: A, B" in text
+        assert text == generate_text(cls, graph, build_class_method_index(graph))
+
+    def test_class_methods_in_other_files(self, graph: KnowledgeGraph) -> None:
+        """Methods are matched by class name even when none share its file."""
+        cls = _node(NodeLabel.CLASS, "Order", file_path="src/Order.cs")
+        part_a = _node(
+            NodeLabel.METHOD, "Save", file_path="src/Order.Persist.cs", class_name="Order"
+        )
+        part_b = _node(
+            NodeLabel.METHOD, "Total", file_path="src/Order.Pricing.cs", class_name="Order"
+        )
+        _add(graph, cls, part_a, part_b)
+
+        text = generate_text(cls, graph)
+
+        assert "methods: Save, Total" in text
+
+    def test_class_with_extends_and_implements(self, graph: KnowledgeGraph) -> None:
         """Text lists base classes (EXTENDS) and interfaces (IMPLEMENTS)."""
-        graph = KnowledgeGraph()
         cls = _node(NodeLabel.CLASS, "Admin", file_path="src/models.py")
         base = _node(NodeLabel.CLASS, "User", file_path="src/models.py")
         iface = _node(NodeLabel.INTERFACE, "Serializable", file_path="src/types.py")
@@ -229,9 +266,8 @@ class TestClassText:
 class TestFileText:
     """generate_text for FILE nodes."""
 
-    def test_file_basic_info(self) -> None:
+    def test_file_basic_info(self, graph: KnowledgeGraph) -> None:
         """Text includes name and path."""
-        graph = KnowledgeGraph()
         file_node = _node(NodeLabel.FILE, "auth.py", file_path="src/auth.py")
         graph.add_node(file_node)
 
@@ -240,9 +276,8 @@ class TestFileText:
         assert "file auth.py" in text
         assert "src/auth.py" in text
 
-    def test_file_with_defines_and_imports(self) -> None:
+    def test_file_with_defines_and_imports(self, graph: KnowledgeGraph) -> None:
         """Text lists symbols defined and imports."""
-        graph = KnowledgeGraph()
         file_node = _node(NodeLabel.FILE, "auth.py", file_path="src/auth.py")
         fn = _node(NodeLabel.FUNCTION, "validate", file_path="src/auth.py")
         cls = _node(NodeLabel.CLASS, "AuthService", file_path="src/auth.py")
@@ -267,64 +302,42 @@ class TestFileText:
 # ---------------------------------------------------------------------------
 
 
-class TestInterfaceText:
-    """generate_text for INTERFACE nodes."""
-
-    def test_interface_basic(self) -> None:
-        graph = KnowledgeGraph()
-        iface = _node(
-            NodeLabel.INTERFACE,
-            "Serializable",
-            file_path="src/types.ts",
-            signature="interface Serializable { toJSON(): string; }",
-        )
-        graph.add_node(iface)
-
-        text = generate_text(iface, graph)
-
-        assert "interface Serializable" in text
-        assert "src/types.ts" in text
-        assert "interface Serializable { toJSON(): string; }" in text
-
-
-class TestTypeAliasText:
-    """generate_text for TYPE_ALIAS nodes."""
-
-    def test_type_alias_basic(self) -> None:
-        graph = KnowledgeGraph()
-        ta = _node(
-            NodeLabel.TYPE_ALIAS,
-            "UserID",
-            file_path="src/types.py",
-            signature="type UserID = int",
-        )
-        graph.add_node(ta)
-
-        text = generate_text(ta, graph)
-
-        assert "type_alias UserID" in text
-        assert "src/types.py" in text
-        assert "type UserID = int" in text
-
-
-class TestEnumText:
-    """generate_text for ENUM nodes."""
-
-    def test_enum_basic(self) -> None:
-        graph = KnowledgeGraph()
-        enum_node = _node(
-            NodeLabel.ENUM,
-            "Color",
-            file_path="src/enums.py",
-            signature="class Color(Enum): RED = 1; GREEN = 2; BLUE = 3",
+class TestTypeDefinitionText:
+    """generate_text for INTERFACE, TYPE_ALIAS, and ENUM nodes."""
+
+    @pytest.mark.parametrize(
+        ("label", "name", "file_path", "signature"),
+        [
+            (
+                NodeLabel.INTERFACE,
+                "Serializable",
+                "src/types.ts",
+                "interface Serializable { toJSON(): string; }",
+            ),
+            (NodeLabel.TYPE_ALIAS, "UserID", "src/types.py", "type UserID = int"),
+            (
+                NodeLabel.ENUM,
+                "Color",
+                "src/enums.py",
+                "class Color(Enum): RED = 1; GREEN = 2; BLUE = 3",
+            ),
+        ],
+        ids=["interface", "type_alias", "enum"],
+    )
+    def test_header_and_signature(
+        self,
+        graph: KnowledgeGraph,
+        label: NodeLabel,
+        name: str,
+        file_path: str,
+        signature: str,
+    ) -> None:
+        node = _node(label, name, file_path=file_path, signature=signature)
+        graph.add_node(node)
+
+        assert generate_text(node, graph) == (
+            f"{label.value} {name} in {file_path}\nsignature: {signature}"
         )
-        graph.add_node(enum_node)
-
-        text = generate_text(enum_node, graph)
-
-        assert "enum Color" in text
-        assert "src/enums.py" in text
-        assert "class Color(Enum)" in text
 
 
 # ---------------------------------------------------------------------------
@@ -335,9 +348,8 @@ class TestEnumText:
 class TestFolderText:
     """generate_text for FOLDER nodes."""
 
-    def test_folder_with_contents(self) -> None:
+    def test_folder_with_contents(self, graph: KnowledgeGraph) -> None:
         """Text lists files the folder contains (outgoing CONTAINS)."""
-        graph = KnowledgeGraph()
         folder = _node(NodeLabel.FOLDER, "auth", file_path="src/auth")
         f1 = _node(NodeLabel.FILE, "validate.py", file_path="src/auth/validate.py")
         f2 = _node(NodeLabel.FILE, "hash.py", file_path="src/auth/hash.py")
@@ -363,9 +375,8 @@ class TestFolderText:
 class TestCommunityText:
     """generate_text for COMMUNITY nodes."""
 
-    def test_community_with_members(self) -> None:
+    def test_community_with_members(self, graph: KnowledgeGraph) -> None:
         """Text lists member symbols (incoming MEMBER_OF)."""
-        graph = KnowledgeGraph()
         community = _node(NodeLabel.COMMUNITY, "Auth")
         member1 = _node(NodeLabel.FUNCTION, "validate", file_path="src/auth.py")
         member2 = _node(NodeLabel.FUNCTION, "hash_password", file_path="src/auth.py")
@@ -391,9 +402,8 @@ class TestCommunityText:
 class TestProcessText:
     """generate_text for PROCESS nodes."""
 
-    def test_process_with_steps(self) -> None:
+    def test_process_with_steps(self, graph: KnowledgeGraph) -> None:
         """Text lists steps (incoming STEP_IN_PROCESS)."""
-        graph = KnowledgeGraph()
         process = _node(NodeLabel.PROCESS, "user_registration")
         step1 = _node(NodeLabel.FUNCTION, "validate_input", file_path="src/reg.py")
         step2 = _node(NodeLabel.FUNCTION, "create_user", file_path="src/reg.py")
@@ -422,9 +432,8 @@ class TestProcessText:
 class TestEdgeCases:
     """Edge cases and robustness."""
 
-    def test_node_with_no_edges(self) -> None:
+    def test_node_with_no_edges(self, graph: KnowledgeGraph) -> None:
         """A standalone node still produces valid text."""
-        graph = KnowledgeGraph()
         fn = _node(
             NodeLabel.FUNCTION,
             "orphan_func",
@@ -435,24 +444,46 @@ class TestEdgeCases:
 
         text = generate_text(fn, graph)
 
-        assert "function orphan_func" in text
-        assert "src/utils.py" in text
-        # Should not contain empty "calls:" or "called by:" sections
-        assert text.strip()  # Non-empty
+        # Header and signature only: no empty "calls:" or "called by:" sections.
+        assert text == (
+            "function orphan_func in src/utils.py\n"
+            "signature: def orphan_func() -> None"
+        )
 
-    def test_empty_signature_is_omitted(self) -> None:
+    def test_empty_signature_is_omitted(self, graph: KnowledgeGraph) -> None:
         """If signature is empty, it should not produce a blank line."""
-        graph = KnowledgeGraph()
         fn = _node(NodeLabel.FUNCTION, "simple", file_path="src/app.py", signature="")
         graph.add_node(fn)
 
         text = generate_text(fn, graph)
 
         assert "signature:" not in text.lower()
+        assert text == "function simple in src/app.py"
+
+    def test_dangling_edges_emit_no_section(self, graph: KnowledgeGraph) -> None:
+        """Edges whose target node is missing do not produce empty sections."""
+        cls = _node(NodeLabel.CLASS, "Child", file_path="src/models.py")
+        graph.add_node(cls)
+        graph.add_relationship(_rel(cls.id, "class:src/gone.py:Base", RelType.EXTENDS))
+
+        assert generate_text(cls, graph) == "class Child in src/models.py"
+
+    def test_dangling_edges_are_skipped_in_name_lists(self, graph: KnowledgeGraph) -> None:
+        """Only neighbours present in the graph are named."""
+        folder = _node(NodeLabel.FOLDER, "src", file_path="src")
+        community = _node(NodeLabel.COMMUNITY, "core")
+        f1 = _node(NodeLabel.FILE, "a.py", file_path="src/a.py")
+        _add(graph, folder, community, f1)
+        graph.add_relationship(_rel(folder.id, f1.id, RelType.CONTAINS))
+        graph.add_relationship(_rel(folder.id, "file:src/gone.py:", RelType.CONTAINS))
+        graph.add_relationship(_rel(f1.id, community.id, RelType.MEMBER_OF))
+        graph.add_relationship(_rel("function:src/gone.py:f", community.id, RelType.MEMBER_OF))
 
-    def test_method_with_calls_and_types(self) -> None:
+        assert generate_text(folder, graph) == "folder src in src\ncontains: a.py"
+        assert generate_text(community, graph) == "community core\nmembers: a.py"
+
+    def test_method_with_calls_and_types(self, graph: KnowledgeGraph) -> None:
         """Method behaves like function for calls and type relationships."""
-        graph = KnowledgeGraph()
         method = _node(
             NodeLabel.METHOD,
             "process",
@@ -473,3 +504,37 @@ class TestEdgeCases:
         assert "Worker" in text
         assert "transform" in text
         assert "Data" in text
+
+
+# ---------------------------------------------------------------------------
+# Tests — Memoization
+# ---------------------------------------------------------------------------
+
+
+class TestTextCache:
+    """generate_text reuses texts until the graph changes."""
+
+    def test_repeat_call_returns_cached_text(self, graph: KnowledgeGraph) -> None:
+        fn = _node(NodeLabel.FUNCTION, "run", file_path="src/app.py")
+        graph.add_node(fn)
+
+        assert generate_text(fn, graph) is generate_text(fn, graph)
+
+    def test_graph_mutation_refreshes_text(self, graph: KnowledgeGraph) -> None:
+        caller = _node(NodeLabel.FUNCTION, "run", file_path="src/app.py")
+        callee = _node(NodeLabel.FUNCTION, "helper", file_path="src/app.py")
+        _add(graph, caller, callee)
+        assert "calls:" not in generate_text(caller, graph)
+
+        graph.add_relationship(_rel(caller.id, callee.id, RelType.CALLS))
+
+        assert "calls: helper" in generate_text(caller, graph)
+
+    def test_node_outside_graph_is_not_cached(self, graph: KnowledgeGraph) -> None:
+        fn = _node(NodeLabel.FUNCTION, "run", file_path="src/app.py")
+        graph.add_node(fn)
+        generate_text(fn, graph)
+
+        detached = _node(NodeLabel.FUNCTION, "run", file_path="src/app.py", signature="def run()")
+
+        assert "signature: def run()" in generate_text(detached, graph)
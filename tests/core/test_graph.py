@@ -39,6 +39,17 @@ def _make_node(
     )
 
 
+def _make_method(name: str, file_path: str, class_name: str) -> GraphNode:
+    """Helper to build a METHOD node belonging to *class_name*."""
+    return GraphNode(
+        id=generate_id(NodeLabel.METHOD, file_path, f"{class_name}.{name}"),
+        label=NodeLabel.METHOD,
+        name=name,
+        file_path=file_path,
+        class_name=class_name,
+    )
+
+
 def _make_rel(
     source: str,
     target: str,
@@ -80,7 +91,7 @@ class TestAddGetNode:
         n2 = _make_node(name="b")
         graph.add_node(n1)
         graph.add_node(n2)
-        assert set(n.id for n in list(graph.iter_nodes())) == {n1.id, n2.id}
+        assert set(graph.node_ids()) == {n1.id, n2.id}
 
 
 # ---------------------------------------------------------------------------
@@ -113,7 +124,64 @@ class TestAddRelationship:
         graph.add_relationship(r1)
         graph.add_relationship(r2)
 
-        assert set(r.id for r in list(graph.iter_relationships())) == {"r1", "r2"}
+        assert set(graph.relationship_ids()) == {"r1", "r2"}
+
+    def test_same_id_replaces_distinct_ids_coexist(self, graph: KnowledgeGraph) -> None:
+        """Relationships are keyed by id, not by (source, target, type).
+
+        The types phase emits one USES_TYPE edge per role between the same
+        pair of symbols, so edges that share endpoints and type must coexist.
+        """
+        n1 = _make_node(name="a")
+        n2 = _make_node(label=NodeLabel.CLASS, name="B")
+        graph.add_nodes([n1, n2])
+
+        graph.add_relationship(_make_rel(n1.id, n2.id, RelType.USES_TYPE, rel_id="param"))
+        graph.add_relationship(_make_rel(n1.id, n2.id, RelType.USES_TYPE, rel_id="return"))
+        graph.add_relationship(_make_rel(n1.id, n2.id, RelType.USES_TYPE, rel_id="param"))
+
+        assert graph.relationship_count == 2
+        assert sorted(r.id for r in graph.get_outgoing(n1.id)) == ["param", "return"]
+        assert sorted(r.id for r in graph.get_incoming(n2.id)) == ["param", "return"]
+
+
+# ---------------------------------------------------------------------------
+# Batch insertion
+# ---------------------------------------------------------------------------
+
+
+class TestBulkInsert:
+    def test_add_nodes_and_relationships(self, graph: KnowledgeGraph) -> None:
+        n1 = _make_node(name="a")
+        n2 = _make_node(name="b")
+        graph.add_nodes([n1, n2])
+        graph.add_relationships([_make_rel(n1.id, n2.id, rel_id="r1")])
+
+        assert graph.node_count == 2
+        assert [r.id for r in graph.get_outgoing(n1.id)] == ["r1"]
+        assert [r.id for r in graph.get_incoming(n2.id)] == ["r1"]
+
+    def test_bulk_insert_defers_until_exit(self, graph: KnowledgeGraph) -> None:
+        n1 = _make_node(name="a")
+        n2 = _make_node(name="b")
+        with graph.bulk_insert():
+            graph.add_node(n1)
+            graph.add_node(n2)
+            graph.add_relationship(_make_rel(n1.id, n2.id, rel_id="r1"))
+            assert graph.node_count == 0
+
+        assert graph.get_node(n1.id) is n1
+        assert graph.get_nodes_by_label(NodeLabel.FUNCTION) == [n1, n2]
+        assert [r.id for r in graph.get_relationships_by_type(RelType.CALLS)] == ["r1"]
+
+    def test_bulk_insert_discards_on_error(self, graph: KnowledgeGraph) -> None:
+        with pytest.raises(RuntimeError), graph.bulk_insert():
+            graph.add_node(_make_node(name="a"))
+            raise RuntimeError("boom")
+
+        assert graph.node_count == 0
+        graph.add_node(_make_node(name="b"))
+        assert graph.node_count == 1
 
 
 # ---------------------------------------------------------------------------
@@ -150,9 +218,22 @@ class TestRemoveNode:
         # Removing n2 should cascade r1 (source=n2 in target) and r2 (source=n2)
         graph.remove_node(n2.id)
 
-        remaining_ids = {r.id for r in list(graph.iter_relationships())}
+        remaining_ids = set(graph.relationship_ids())
         assert remaining_ids == {"r3"}, f"Expected only r3, got {remaining_ids}"
 
+    def test_remove_node_cascades_self_loop(self, graph: KnowledgeGraph) -> None:
+        n1 = _make_node(name="a")
+        n2 = _make_node(name="b")
+        graph.add_nodes([n1, n2])
+        graph.add_relationship(_make_rel(n1.id, n1.id, rel_id="loop"))
+        graph.add_relationship(_make_rel(n2.id, n1.id, rel_id="in"))
+
+        graph.remove_node(n1.id)
+
+        assert graph.relationship_count == 0
+        assert graph.get_outgoing(n2.id) == []
+        assert graph.rel_type_counts() == {}
+
 
 # ---------------------------------------------------------------------------
 # Remove nodes by file
@@ -177,6 +258,26 @@ class TestRemoveNodesByFile:
     def test_returns_zero_when_no_match(self, graph: KnowledgeGraph) -> None:
         assert graph.remove_nodes_by_file("nonexistent.py") == 0
 
+    def test_follows_node_moved_to_another_file(self, graph: KnowledgeGraph) -> None:
+        node = _make_node(name="moved", file_path="src/a.py")
+        graph.add_node(node)
+        graph.add_node(
+            GraphNode(id=node.id, label=node.label, name="moved", file_path="src/b.py")
+        )
+
+        assert graph.remove_nodes_by_file("src/a.py") == 0
+        assert graph.remove_nodes_by_file("src/b.py") == 1
+        assert graph.get_node(node.id) is None
+        assert graph.get_nodes_by_label(node.label) == []
+
+    def test_skips_nodes_removed_individually(self, graph: KnowledgeGraph) -> None:
+        n1 = _make_node(name="f1", file_path="src/a.py")
+        n2 = _make_node(name="f2", file_path="src/a.py")
+        graph.add_nodes([n1, n2])
+
+        graph.remove_node(n1.id)
+        assert graph.remove_nodes_by_file("src/a.py") == 1
+
     def test_cascades_relationships(self, graph: KnowledgeGraph) -> None:
         n1 = _make_node(name="f1", file_path="src/a.py")
         n2 = _make_node(name="f2", file_path="src/b.py")
@@ -209,6 +310,21 @@ class TestQueryByLabelAndType:
     def test_get_nodes_by_label_empty(self, graph: KnowledgeGraph) -> None:
         assert graph.get_nodes_by_label(NodeLabel.FILE) == []
 
+    def test_get_nodes_by_label_tracks_relabel_and_remove(
+        self, graph: KnowledgeGraph
+    ) -> None:
+        node = _make_node(label=NodeLabel.FUNCTION, name="thing")
+        graph.add_node(node)
+        graph.add_node(GraphNode(id=node.id, label=NodeLabel.CLASS, name="thing"))
+
+        assert graph.get_nodes_by_label(NodeLabel.FUNCTION) == []
+        assert [n.id for n in graph.get_nodes_by_label(NodeLabel.CLASS)] == [node.id]
+        assert graph.count_nodes_by_label(NodeLabel.CLASS) == 1
+
+        graph.remove_node(node.id)
+        assert graph.get_nodes_by_label(NodeLabel.CLASS) == []
+        assert graph.count_nodes_by_label(NodeLabel.CLASS) == 0
+
     def test_get_relationships_by_type(self, graph: KnowledgeGraph) -> None:
         n1 = _make_node(name="a")
         n2 = _make_node(name="b")
@@ -227,6 +343,52 @@ class TestQueryByLabelAndType:
     def test_get_relationships_by_type_empty(self, graph: KnowledgeGraph) -> None:
         assert graph.get_relationships_by_type(RelType.EXTENDS) == []
 
+    def test_get_relationships_by_type_tracks_replace_and_remove(
+        self, graph: KnowledgeGraph
+    ) -> None:
+        n1 = _make_node(name="a")
+        n2 = _make_node(name="b")
+        graph.add_node(n1)
+        graph.add_node(n2)
+
+        graph.add_relationship(_make_rel(n1.id, n2.id, RelType.CALLS, rel_id="r1"))
+        graph.add_relationship(_make_rel(n1.id, n2.id, RelType.USES_TYPE, rel_id="r1"))
+
+        assert graph.get_relationships_by_type(RelType.CALLS) == []
+        assert [r.id for r in graph.get_relationships_by_type(RelType.USES_TYPE)] == ["r1"]
+
+        graph.remove_node(n2.id)
+        assert graph.get_relationships_by_type(RelType.USES_TYPE) == []
+
+
+class TestMethodsOfClass:
+    def test_scoped_to_file_and_class(self, graph: KnowledgeGraph) -> None:
+        m1 = _make_method("run", "src/a.py", "Svc")
+        m2 = _make_method("run", "src/a.py", "Other")
+        m3 = _make_method("stop", "src/b.py", "Svc")
+        graph.add_nodes([m1, m2])
+        graph.add_node(m3)
+
+        assert graph.methods_of_class("src/a.py", "Svc") == [m1]
+        assert graph.methods_of_class("src/b.py", "Svc") == [m3]
+        assert graph.methods_of_class("src/c.py", "Svc") == []
+
+    def test_tracks_replace_and_remove(self, graph: KnowledgeGraph) -> None:
+        method = _make_method("run", "src/a.py", "Svc")
+        graph.add_node(method)
+        graph.add_node(
+            GraphNode(id=method.id, label=NodeLabel.FUNCTION, name="run", file_path="src/a.py")
+        )
+        assert graph.methods_of_class("src/a.py", "Svc") == []
+
+        graph.add_node(method)
+        graph.remove_node(method.id)
+        assert graph.methods_of_class("src/a.py", "Svc") == []
+
+        graph.add_node(method)
+        graph.remove_nodes_by_file("src/a.py")
+        assert graph.methods_of_class("src/a.py", "Svc") == []
+
 
 # ---------------------------------------------------------------------------
 # Query — outgoing / incoming
@@ -280,12 +442,51 @@ class TestTraversal:
         assert len(inc_imports) == 1
         assert inc_imports[0].id == "r2"
 
+    def test_adjacency_follows_replaced_and_cascaded_edges(
+        self, graph: KnowledgeGraph
+    ) -> None:
+        n1 = _make_node(name="a")
+        n2 = _make_node(name="b")
+        n3 = _make_node(name="c")
+        graph.add_nodes([n1, n2, n3])
+
+        graph.add_relationship(_make_rel(n1.id, n2.id, rel_id="r1"))
+        # Re-adding r1 with new endpoints moves it between adjacency buckets.
+        graph.add_relationship(_make_rel(n3.id, n2.id, rel_id="r1"))
+        graph.add_relationship(_make_rel(n3.id, n1.id, rel_id="r2"))
+
+        assert graph.get_outgoing(n1.id) == []
+        assert {r.id for r in graph.get_outgoing(n3.id)} == {"r1", "r2"}
+        assert [r.id for r in graph.get_incoming(n2.id)] == ["r1"]
+
+        # Cascading n1 drops r2 from n3's outgoing bucket too.
+        graph.remove_node(n1.id)
+        assert [r.id for r in graph.get_outgoing(n3.id)] == ["r1"]
+
     def test_get_outgoing_no_matches(self, graph: KnowledgeGraph) -> None:
         assert graph.get_outgoing("nonexistent") == []
 
     def test_get_incoming_no_matches(self, graph: KnowledgeGraph) -> None:
         assert graph.get_incoming("nonexistent") == []
 
+    def test_iterators_match_list_getters(self, graph: KnowledgeGraph) -> None:
+        n1 = _make_node(name="a")
+        n2 = _make_node(label=NodeLabel.CLASS, name="B")
+        graph.add_nodes([n1, n2])
+        graph.add_relationship(_make_rel(n1.id, n2.id, RelType.CALLS, rel_id="r1"))
+        graph.add_relationship(_make_rel(n1.id, n2.id, RelType.USES_TYPE, rel_id="r2"))
+
+        assert list(graph.iter_outgoing(n1.id)) == graph.get_outgoing(n1.id)
+        assert [r.id for r in graph.iter_outgoing(n1.id, RelType.USES_TYPE)] == ["r2"]
+        assert [r.id for r in graph.iter_incoming(n2.id, RelType.CALLS)] == ["r1"]
+        assert list(graph.iter_incoming("nonexistent")) == []
+        assert list(graph.iter_nodes_by_label(NodeLabel.CLASS)) == [n2]
+        assert list(graph.iter_nodes_by_label(NodeLabel.ENUM)) == []
+        assert list(graph.iter_relationships_by_type(RelType.CALLS)) == (
+            graph.get_relationships_by_type(RelType.CALLS)
+        )
+        assert list(graph.iter_relationships_by_type(RelType.EXTENDS)) == []
+
 
 # ---------------------------------------------------------------------------
 # Stats
@@ -314,3 +515,68 @@ class TestStats:
 
         graph.remove_node(n1.id)
         assert graph.stats() == {"nodes": 1, "relationships": 0}
+
+    def test_per_kind_counts(self, graph: KnowledgeGraph) -> None:
+        fn = _make_node(name="a")
+        cls = _make_node(label=NodeLabel.CLASS, name="A")
+        graph.add_nodes([fn, cls])
+        graph.add_relationship(_make_rel(fn.id, cls.id))
+        graph.add_relationship(_make_rel(fn.id, cls.id, RelType.USES_TYPE))
+
+        assert graph.label_counts() == {NodeLabel.FUNCTION: 1, NodeLabel.CLASS: 1}
+        assert graph.rel_type_counts() == {RelType.CALLS: 1, RelType.USES_TYPE: 1}
+        assert graph.count_relationships_by_type(RelType.CALLS) == 1
+
+        graph.remove_node(fn.id)
+        assert graph.label_counts() == {NodeLabel.CLASS: 1}
+        assert graph.rel_type_counts() == {}
+        assert graph.count_relationships_by_type(RelType.CALLS) == 0
+
+    def test_version_changes_on_every_mutation(self, graph: KnowledgeGraph) -> None:
+        n1 = _make_node(name="a")
+        n2 = _make_node(name="b")
+        seen = [graph.version]
+
+        graph.add_node(n1)
+        seen.append(graph.version)
+        graph.add_nodes([n2])
+        seen.append(graph.version)
+        graph.add_relationship(_make_rel(n1.id, n2.id))
+        seen.append(graph.version)
+        graph.remove_node(n1.id)
+        seen.append(graph.version)
+        graph.remove_nodes_by_file(n2.file_path)
+        seen.append(graph.version)
+
+        assert len(set(seen)) == len(seen)
+
+        # Queries and no-op removals leave the version alone.
+        graph.get_nodes_by_label(NodeLabel.FUNCTION)
+        graph.remove_node("missing")
+        assert graph.version == seen[-1]
+
+    def test_reset_empties_every_index(self, graph: KnowledgeGraph) -> None:
+        n1 = _make_node(name="a")
+        n2 = _make_method("run", "src/app.py", "Worker")
+        graph.add_nodes([n1, n2])
+        graph.add_relationship(_make_rel(n1.id, n2.id))
+        before = graph.version
+
+        graph.reset()
+
+        assert graph.stats() == {"nodes": 0, "relationships": 0}
+        assert graph.label_counts() == {}
+        assert graph.rel_type_counts() == {}
+        assert graph.get_outgoing(n1.id) == []
+        assert graph.get_incoming(n2.id) == []
+        assert graph.methods_of_class("src/app.py", "Worker") == []
+        assert graph.remove_nodes_by_file("src/app.py") == 0
+        assert graph.version > before
+
+    def test_reset_inside_bulk_insert_drops_buffer(self, graph: KnowledgeGraph) -> None:
+        with graph.bulk_insert():
+            graph.add_node(_make_node(name="a"))
+            graph.reset()
+            graph.add_node(_make_node(name="b"))
+
+        assert [n.name for n in graph.iter_nodes()] == ["b"]
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+from collections.abc import Callable
+
 import pytest
 
 from axon_pro.core.graph.model import (
@@ -21,22 +25,24 @@ from axon_pro.core.graph.model import (
 class TestNodeLabel:
     """Verify every expected node label exists and has correct string values."""
 
-    EXPECTED = [
-        "FILE",
-        "FOLDER",
-        "FUNCTION",
-        "CLASS",
-        "METHOD",
-        "INTERFACE",
-        "TYPE_ALIAS",
-        "ENUM",
-        "COMMUNITY",
-        "PROCESS",
-    ]
-
-    @pytest.mark.parametrize("name", EXPECTED)
-    def test_label_exists(self, name: str) -> None:
-        assert hasattr(NodeLabel, name), f"NodeLabel.{name} is missing"
+    EXPECTED = frozenset(
+        {
+            "FILE",
+            "FOLDER",
+            "FUNCTION",
+            "CLASS",
+            "METHOD",
+            "INTERFACE",
+            "TYPE_ALIAS",
+            "ENUM",
+            "COMMUNITY",
+            "PROCESS",
+        }
+    )
+
+    def test_labels_exist(self) -> None:
+        missing = self.EXPECTED - {label.name for label in NodeLabel}
+        assert not missing, f"NodeLabel is missing {sorted(missing)}"
 
     def test_label_count(self) -> None:
         assert len(NodeLabel) == len(self.EXPECTED)
@@ -54,23 +60,25 @@ class TestNodeLabel:
 class TestRelType:
     """Verify every expected relationship type exists."""
 
-    EXPECTED = [
-        "CONTAINS",
-        "DEFINES",
-        "CALLS",
-        "IMPORTS",
-        "EXTENDS",
-        "IMPLEMENTS",
-        "MEMBER_OF",
-        "STEP_IN_PROCESS",
-        "USES_TYPE",
-        "EXPORTS",
-        "COUPLED_WITH",
-    ]
-
-    @pytest.mark.parametrize("name", EXPECTED)
-    def test_rel_type_exists(self, name: str) -> None:
-        assert hasattr(RelType, name), f"RelType.{name} is missing"
+    EXPECTED = frozenset(
+        {
+            "CONTAINS",
+            "DEFINES",
+            "CALLS",
+            "IMPORTS",
+            "EXTENDS",
+            "IMPLEMENTS",
+            "MEMBER_OF",
+            "STEP_IN_PROCESS",
+            "USES_TYPE",
+            "EXPORTS",
+            "COUPLED_WITH",
+        }
+    )
+
+    def test_rel_types_exist(self) -> None:
+        missing = self.EXPECTED - {rel.name for rel in RelType}
+        assert not missing, f"RelType is missing {sorted(missing)}"
 
     def test_rel_type_count(self) -> None:
         assert len(RelType) == len(self.EXPECTED)
@@ -140,6 +148,55 @@ class TestGraphNode:
         a.properties["key"] = "val"
         assert "key" not in b.properties
 
+    def test_uses_slots(self) -> None:
+        """Nodes carry no per-instance __dict__ and reject unknown attributes."""
+        node = GraphNode(id="n1", label=NodeLabel.CLASS, name="Foo")
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.extra = 1  # type: ignore[attr-defined]
+
+    @pytest.mark.parametrize(
+        "clone",
+        [copy.deepcopy, lambda n: pickle.loads(pickle.dumps(n))],
+        ids=["deepcopy", "pickle"],
+    )
+    def test_slotted_node_clones(self, clone: Callable[[GraphNode], GraphNode]) -> None:
+        """Test fixtures deep-copy shared graphs; slots must survive that."""
+        node = GraphNode(
+            id="n1",
+            label=NodeLabel.METHOD,
+            name="run",
+            file_path="src/a.py",
+            class_name="Worker",
+            properties={"is_protocol": True},
+        )
+        cloned = clone(node)
+
+        assert cloned == node
+        assert cloned.properties is not node.properties
+
+    def test_interns_file_path_and_class_name(self) -> None:
+        a, b = (
+            GraphNode(
+                id=name,
+                label=NodeLabel.METHOD,
+                name=name,
+                file_path="".join(["src/", "svc.py"]),
+                class_name="".join(["User", "Service"]),
+            )
+            for name in ("a", "b")
+        )
+        assert a.file_path is b.file_path
+        assert a.class_name is b.class_name
+
+    @pytest.mark.parametrize("value", [None, ""], ids=["none", "empty"])
+    def test_missing_file_path_and_class_name_accepted(self, value: str | None) -> None:
+        node = GraphNode(
+            id="a", label=NodeLabel.FUNCTION, name="a", file_path=value, class_name=value
+        )
+        assert node.file_path == value
+        assert node.class_name == value
+
     def test_full_creation(self) -> None:
         node = GraphNode(
             id="function:app.py:main",
@@ -198,6 +255,10 @@ class TestGraphRelationship:
         a.properties["weight"] = 5
         assert "weight" not in b.properties
 
+    def test_uses_slots(self) -> None:
+        rel = GraphRelationship(id="r", type=RelType.CALLS, source="s", target="t")
+        assert not hasattr(rel, "__dict__")
+
     def test_with_properties(self) -> None:
         rel = GraphRelationship(
             id="r3",
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import copy
+from collections.abc import Sequence
+
 import pytest
 
 from axon_pro.core.graph.graph import KnowledgeGraph
@@ -13,16 +16,25 @@ from axon_pro.core.parsers.base import ParseResult
 
 _HERITAGE_LABELS = (NodeLabel.CLASS, NodeLabel.INTERFACE)
 
+_ID_ANIMAL = generate_id(NodeLabel.CLASS, "src/models.py", "Animal")
+_ID_DOG = generate_id(NodeLabel.CLASS, "src/models.py", "Dog")
+_ID_USER = generate_id(NodeLabel.CLASS, "src/models.ts", "User")
+_ID_SERIALIZABLE = generate_id(NodeLabel.INTERFACE, "src/types.ts", "Serializable")
+_ID_PRINTABLE = generate_id(NodeLabel.INTERFACE, "src/types.ts", "Printable")
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def graph() -> KnowledgeGraph:
+@pytest.fixture(scope="module")
+def graph_proto() -> KnowledgeGraph:
     """Return a KnowledgeGraph pre-populated with Class and Interface nodes.
 
+    Built once per module.  Tests that only read the graph take this
+    fixture directly; tests that mutate it take :func:`graph` instead.
+
     Layout:
     - Class:src/models.py:Animal
     - Class:src/models.py:Dog
@@ -34,7 +46,7 @@ def graph() -> KnowledgeGraph:
     # Python class nodes
     g.add_node(
         GraphNode(
-            id=generate_id(NodeLabel.CLASS, "src/models.py", "Animal"),
+            id=_ID_ANIMAL,
             label=NodeLabel.CLASS,
             name="Animal",
             file_path="src/models.py",
@@ -42,7 +54,7 @@ def graph() -> KnowledgeGraph:
     )
     g.add_node(
         GraphNode(
-            id=generate_id(NodeLabel.CLASS, "src/models.py", "Dog"),
+            id=_ID_DOG,
             label=NodeLabel.CLASS,
             name="Dog",
             file_path="src/models.py",
@@ -52,7 +64,7 @@ def graph() -> KnowledgeGraph:
     # TypeScript interface node
     g.add_node(
         GraphNode(
-            id=generate_id(NodeLabel.INTERFACE, "src/types.ts", "Serializable"),
+            id=_ID_SERIALIZABLE,
             label=NodeLabel.INTERFACE,
             name="Serializable",
             file_path="src/types.ts",
@@ -62,7 +74,7 @@ def graph() -> KnowledgeGraph:
     # TypeScript class node
     g.add_node(
         GraphNode(
-            id=generate_id(NodeLabel.CLASS, "src/models.ts", "User"),
+            id=_ID_USER,
             label=NodeLabel.CLASS,
             name="User",
             file_path="src/models.ts",
@@ -72,6 +84,53 @@ def graph() -> KnowledgeGraph:
     return g
 
 
+@pytest.fixture(scope="module")
+def name_index(graph_proto: KnowledgeGraph) -> dict[str, list[str]]:
+    """Return the heritage-label name index of :func:`graph_proto`, built once."""
+    return build_name_index(graph_proto, _HERITAGE_LABELS)
+
+
+@pytest.fixture()
+def graph(graph_proto: KnowledgeGraph) -> KnowledgeGraph:
+    """Return a private deep copy of :func:`graph_proto`.
+
+    process_heritage adds edges and annotates node properties, so the
+    copy must not share nodes with the prototype.
+    """
+    return copy.deepcopy(graph_proto)
+
+
+@pytest.fixture(scope="module")
+def multi_heritage_graph(graph_proto: KnowledgeGraph) -> KnowledgeGraph:
+    """Return a copy of :func:`graph_proto` after one multi-heritage pass.
+
+    Adds Interface:src/types.ts:Printable, then processes User extending
+    Animal (cross-file) and implementing both Serializable and Printable.
+    Built once per module; the tests using it only read the result.
+    """
+    g = copy.deepcopy(graph_proto)
+    g.add_node(
+        GraphNode(
+            id=_ID_PRINTABLE,
+            label=NodeLabel.INTERFACE,
+            name="Printable",
+            file_path="src/types.ts",
+        )
+    )
+    parse_data = [
+        _make_parse_data(
+            "src/models.ts",
+            [
+                ("User", "extends", "Animal"),
+                ("User", "implements", "Serializable"),
+                ("User", "implements", "Printable"),
+            ],
+        ),
+    ]
+    process_heritage(parse_data, g)
+    return g
+
+
 def _make_parse_data(
     file_path: str,
     heritage: list[tuple[str, str, str]],
@@ -84,6 +143,17 @@ def _make_parse_data(
     )
 
 
+# Shared inputs; process_heritage only reads its parse data, so one instance
+# serves every test that processes the same tuple.
+_PARSE_DOG_EXTENDS_ANIMAL = [_make_parse_data("src/models.py", [("Dog", "extends", "Animal")])]
+_PARSE_USER_IMPL_SERIALIZABLE = [
+    _make_parse_data("src/models.ts", [("User", "implements", "Serializable")])
+]
+_PARSE_DOG_EXTENDS_UNKNOWN = [
+    _make_parse_data("src/models.py", [("Dog", "extends", "UnknownBase")])
+]
+
+
 # ---------------------------------------------------------------------------
 # build_name_index tests (heritage labels)
 # ---------------------------------------------------------------------------
@@ -92,21 +162,20 @@ def _make_parse_data(
 class TestBuildSymbolIndex:
     """build_name_index produces a correct mapping from name to node ID."""
 
-    def test_build_symbol_index(self, graph: KnowledgeGraph) -> None:
-        index = build_name_index(graph, _HERITAGE_LABELS)
-
-        assert "Animal" in index
-        assert "Dog" in index
-        assert "Serializable" in index
-        assert "User" in index
+    def test_build_symbol_index(self, name_index: dict[str, list[str]]) -> None:
+        assert "Animal" in name_index
+        assert "Dog" in name_index
+        assert "Serializable" in name_index
+        assert "User" in name_index
 
-    def test_index_values_are_node_ids(self, graph: KnowledgeGraph) -> None:
-        index = build_name_index(graph, _HERITAGE_LABELS)
-
-        for name, node_ids in index.items():
-            assert isinstance(node_ids, list)
+    def test_index_values_are_node_ids(
+        self, graph_proto: KnowledgeGraph, name_index: dict[str, list[str]]
+    ) -> None:
+        for name, node_ids in name_index.items():
+            assert isinstance(node_ids, Sequence)
+            assert not isinstance(node_ids, str)
             for node_id in node_ids:
-                node = graph.get_node(node_id)
+                node = graph_proto.get_node(node_id)
                 assert node is not None
                 assert node.name == name
 
@@ -135,37 +204,46 @@ class TestProcessHeritageExtends:
     """Dog extends Animal creates an EXTENDS relationship."""
 
     def test_process_heritage_extends(self, graph: KnowledgeGraph) -> None:
-        parse_data = [
-            _make_parse_data(
-                "src/models.py",
-                [("Dog", "extends", "Animal")],
-            ),
-        ]
-        process_heritage(parse_data, graph)
+        process_heritage(_PARSE_DOG_EXTENDS_ANIMAL, graph)
 
         extends_rels = graph.get_relationships_by_type(RelType.EXTENDS)
         assert len(extends_rels) == 1
 
         rel = extends_rels[0]
-        assert rel.source == generate_id(NodeLabel.CLASS, "src/models.py", "Dog")
-        assert rel.target == generate_id(NodeLabel.CLASS, "src/models.py", "Animal")
+        assert rel.source == _ID_DOG
+        assert rel.target == _ID_ANIMAL
+
+        # The shared input must come back untouched for the next test.
+        assert _PARSE_DOG_EXTENDS_ANIMAL[0].parse_result.heritage == [("Dog", "extends", "Animal")]
 
     def test_extends_relationship_id_format(
         self, graph: KnowledgeGraph
     ) -> None:
-        parse_data = [
-            _make_parse_data(
-                "src/models.py",
-                [("Dog", "extends", "Animal")],
-            ),
-        ]
-        process_heritage(parse_data, graph)
+        process_heritage(_PARSE_DOG_EXTENDS_ANIMAL, graph)
 
         extends_rels = graph.get_relationships_by_type(RelType.EXTENDS)
         rel = extends_rels[0]
         assert rel.id.startswith("extends:")
         assert "->" in rel.id
 
+    def test_same_file_parent_preferred(self, graph: KnowledgeGraph) -> None:
+        local_animal = generate_id(NodeLabel.CLASS, "src/models.ts", "Animal")
+        graph.add_node(
+            GraphNode(
+                id=local_animal,
+                label=NodeLabel.CLASS,
+                name="Animal",
+                file_path="src/models.ts",
+            )
+        )
+        process_heritage(
+            [_make_parse_data("src/models.ts", [("User", "extends", "Animal")])], graph
+        )
+
+        [rel] = graph.get_relationships_by_type(RelType.EXTENDS)
+        assert rel.source == _ID_USER
+        assert rel.target == local_animal
+
 
 # ---------------------------------------------------------------------------
 # process_heritage — implements
@@ -176,33 +254,19 @@ class TestProcessHeritageImplements:
     """User implements Serializable creates an IMPLEMENTS relationship."""
 
     def test_process_heritage_implements(self, graph: KnowledgeGraph) -> None:
-        parse_data = [
-            _make_parse_data(
-                "src/models.ts",
-                [("User", "implements", "Serializable")],
-            ),
-        ]
-        process_heritage(parse_data, graph)
+        process_heritage(_PARSE_USER_IMPL_SERIALIZABLE, graph)
 
         impl_rels = graph.get_relationships_by_type(RelType.IMPLEMENTS)
         assert len(impl_rels) == 1
 
         rel = impl_rels[0]
-        assert rel.source == generate_id(NodeLabel.CLASS, "src/models.ts", "User")
-        assert rel.target == generate_id(
-            NodeLabel.INTERFACE, "src/types.ts", "Serializable"
-        )
+        assert rel.source == _ID_USER
+        assert rel.target == _ID_SERIALIZABLE
 
     def test_implements_relationship_type(
         self, graph: KnowledgeGraph
     ) -> None:
-        parse_data = [
-            _make_parse_data(
-                "src/models.ts",
-                [("User", "implements", "Serializable")],
-            ),
-        ]
-        process_heritage(parse_data, graph)
+        process_heritage(_PARSE_USER_IMPL_SERIALIZABLE, graph)
 
         impl_rels = graph.get_relationships_by_type(RelType.IMPLEMENTS)
         assert impl_rels[0].type == RelType.IMPLEMENTS
@@ -219,14 +283,8 @@ class TestProcessHeritageUnresolvedParent:
     def test_process_heritage_unresolved_parent(
         self, graph: KnowledgeGraph
     ) -> None:
-        parse_data = [
-            _make_parse_data(
-                "src/models.py",
-                [("Dog", "extends", "UnknownBase")],
-            ),
-        ]
         # Should not raise.
-        process_heritage(parse_data, graph)
+        process_heritage(_PARSE_DOG_EXTENDS_UNKNOWN, graph)
 
         extends_rels = graph.get_relationships_by_type(RelType.EXTENDS)
         assert len(extends_rels) == 0
@@ -254,32 +312,9 @@ class TestProcessHeritageUnresolvedParent:
 class TestProcessHeritageMultiple:
     """A class with one extends and two implements produces 3 relationships."""
 
-    def test_multiple_heritage(self, graph: KnowledgeGraph) -> None:
-        # Add a second interface for the test.
-        graph.add_node(
-            GraphNode(
-                id=generate_id(NodeLabel.INTERFACE, "src/types.ts", "Printable"),
-                label=NodeLabel.INTERFACE,
-                name="Printable",
-                file_path="src/types.ts",
-            )
-        )
-        # User extends Animal (cross-file), implements Serializable, implements Printable
-        # For cross-file extends to work we need Animal in the graph (it is).
-        parse_data = [
-            _make_parse_data(
-                "src/models.ts",
-                [
-                    ("User", "extends", "Animal"),
-                    ("User", "implements", "Serializable"),
-                    ("User", "implements", "Printable"),
-                ],
-            ),
-        ]
-        process_heritage(parse_data, graph)
-
-        extends_rels = graph.get_relationships_by_type(RelType.EXTENDS)
-        impl_rels = graph.get_relationships_by_type(RelType.IMPLEMENTS)
+    def test_multiple_heritage(self, multi_heritage_graph: KnowledgeGraph) -> None:
+        extends_rels = multi_heritage_graph.get_relationships_by_type(RelType.EXTENDS)
+        impl_rels = multi_heritage_graph.get_relationships_by_type(RelType.IMPLEMENTS)
 
         assert len(extends_rels) == 1
         assert len(impl_rels) == 2
@@ -289,36 +324,30 @@ class TestProcessHeritageMultiple:
         assert total == 3
 
     def test_multiple_heritage_sources_are_correct(
-        self, graph: KnowledgeGraph
+        self, multi_heritage_graph: KnowledgeGraph
     ) -> None:
-        graph.add_node(
-            GraphNode(
-                id=generate_id(NodeLabel.INTERFACE, "src/types.ts", "Printable"),
-                label=NodeLabel.INTERFACE,
-                name="Printable",
-                file_path="src/types.ts",
-            )
-        )
+        ext = multi_heritage_graph.get_relationships_by_type(RelType.EXTENDS)
+        imp = multi_heritage_graph.get_relationships_by_type(RelType.IMPLEMENTS)
+
+        assert {rel.source for rel in (*ext, *imp)} == {_ID_USER}
+
+    def test_relationships_added_in_one_batch(self, graph: KnowledgeGraph) -> None:
         parse_data = [
             _make_parse_data(
                 "src/models.ts",
                 [
                     ("User", "extends", "Animal"),
                     ("User", "implements", "Serializable"),
-                    ("User", "implements", "Printable"),
                 ],
             ),
         ]
-        process_heritage(parse_data, graph)
-
-        user_id = generate_id(NodeLabel.CLASS, "src/models.ts", "User")
+        version = graph.version
 
-        all_rels = graph.get_relationships_by_type(
-            RelType.EXTENDS
-        ) + graph.get_relationships_by_type(RelType.IMPLEMENTS)
+        process_heritage(parse_data, graph)
 
-        for rel in all_rels:
-            assert rel.source == user_id
+        assert graph.version == version + 1
+        assert graph.count_relationships_by_type(RelType.EXTENDS) == 1
+        assert graph.count_relationships_by_type(RelType.IMPLEMENTS) == 1
 
 
 # ---------------------------------------------------------------------------
@@ -329,45 +358,26 @@ class TestProcessHeritageMultiple:
 class TestProtocolAnnotation:
     """Heritage with unresolvable Protocol parent annotates the child."""
 
-    def test_protocol_parent_annotates_child(self, graph: KnowledgeGraph) -> None:
-        parse_data = [
-            _make_parse_data(
-                "src/models.py",
-                [("Animal", "extends", "Protocol")],
-            ),
-        ]
-        process_heritage(parse_data, graph)
-
-        animal_id = generate_id(NodeLabel.CLASS, "src/models.py", "Animal")
-        animal = graph.get_node(animal_id)
-        assert animal is not None
-        assert animal.properties.get("is_protocol") is True
-
-    def test_abc_parent_annotates_child(self, graph: KnowledgeGraph) -> None:
+    @pytest.mark.parametrize("parent", ["Protocol", "ABC"])
+    def test_marker_parent_annotates_child(
+        self, graph: KnowledgeGraph, parent: str
+    ) -> None:
         parse_data = [
             _make_parse_data(
                 "src/models.py",
-                [("Animal", "extends", "ABC")],
+                [("Animal", "extends", parent)],
             ),
         ]
         process_heritage(parse_data, graph)
 
-        animal_id = generate_id(NodeLabel.CLASS, "src/models.py", "Animal")
-        animal = graph.get_node(animal_id)
+        animal = graph.get_node(_ID_ANIMAL)
         assert animal is not None
         assert animal.properties.get("is_protocol") is True
 
     def test_non_protocol_parent_not_annotated(self, graph: KnowledgeGraph) -> None:
-        parse_data = [
-            _make_parse_data(
-                "src/models.py",
-                [("Dog", "extends", "UnknownBase")],
-            ),
-        ]
-        process_heritage(parse_data, graph)
+        process_heritage(_PARSE_DOG_EXTENDS_UNKNOWN, graph)
 
-        dog_id = generate_id(NodeLabel.CLASS, "src/models.py", "Dog")
-        dog = graph.get_node(dog_id)
+        dog = graph.get_node(_ID_DOG)
         assert dog is not None
         assert dog.properties.get("is_protocol") is None
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import pytest
+from dataclasses import replace
 from unittest.mock import MagicMock
 
 from axon_pro.core.search.hybrid import hybrid_search
@@ -176,6 +177,20 @@ class TestResultOrdering:
         scores = [r.score for r in results]
         assert scores == sorted(scores, reverse=True)
 
+    def test_ties_keep_first_seen_order(self) -> None:
+        """Equal RRF scores keep FTS hits ahead of vector-only hits."""
+        storage = MagicMock()
+        storage.fts_search.return_value = [
+            SearchResult(node_id="f1", score=1.0),
+            SearchResult(node_id="f2", score=0.9),
+        ]
+        storage.vector_search.return_value = [
+            SearchResult(node_id="v1", score=1.0),
+            SearchResult(node_id="v2", score=0.9),
+        ]
+        results = hybrid_search("q", storage, query_embedding=[0.1], limit=3)
+        assert [r.node_id for r in results] == ["f1", "v1", "f2"]
+
 
 # ---------------------------------------------------------------------------
 # Metadata preservation tests
@@ -259,3 +274,89 @@ class TestEdgeCases:
         results = hybrid_search("dup", storage, query_embedding=[0.1])
         # Should only appear once
         assert sum(1 for r in results if r.node_id == "dup") == 1
+
+    @pytest.mark.parametrize("query_embedding", [None, [0.1]], ids=["fts_only", "fused"])
+    def test_duplicate_keeps_its_rank_slot(self, query_embedding: list[float] | None) -> None:
+        """A skipped duplicate still occupies its position in the ranking."""
+        storage = MagicMock()
+        storage.fts_search.return_value = [
+            SearchResult(node_id="dup", score=1.0),
+            SearchResult(node_id="dup", score=0.9),
+            SearchResult(node_id="x", score=0.8),
+        ]
+        storage.vector_search.return_value = [SearchResult(node_id="v", score=1.0)]
+        results = hybrid_search("dup", storage, query_embedding=query_embedding)
+
+        score_map = {r.node_id: r.score for r in results}
+        assert score_map["x"] == pytest.approx(1.0 / 63)
+
+    def test_single_list_scores_match_fusion(self) -> None:
+        """Without vector hits, ranks still count duplicates and limit applies."""
+        storage = MagicMock()
+        storage.fts_search.return_value = [
+            SearchResult(node_id="a", score=1.0),
+            SearchResult(node_id="a", score=0.9),
+            SearchResult(node_id="b", score=0.8),
+            SearchResult(node_id="c", score=0.7),
+        ]
+        results = hybrid_search("q", storage, query_embedding=None, limit=2, fts_weight=2.0)
+
+        assert [r.node_id for r in results] == ["a", "b"]
+        assert results[0].score == pytest.approx(2.0 / 61)
+        assert results[1].score == pytest.approx(2.0 / 63)
+        storage.vector_search.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+
+class TestResultCache:
+    """Backends with an integer ``version`` get their results memoized."""
+
+    def test_repeat_query_served_from_cache(self, mock_storage: MagicMock) -> None:
+        mock_storage.version = 0
+        first = hybrid_search("validate", mock_storage, query_embedding=[0.1])
+        second = hybrid_search("validate", mock_storage, query_embedding=[0.1])
+
+        assert second == first
+        assert second is not first
+        mock_storage.fts_search.assert_called_once()
+        mock_storage.vector_search.assert_called_once()
+
+    def test_cached_results_are_copies(self, mock_storage: MagicMock) -> None:
+        mock_storage.version = 0
+        first = hybrid_search("validate", mock_storage, query_embedding=None)
+        expected = [replace(result) for result in first]
+        first[0].score = -1.0
+
+        second = hybrid_search("validate", mock_storage, query_embedding=None)
+
+        assert second == expected
+        assert second[0] is not first[0]
+
+    def test_distinct_arguments_miss(self, mock_storage: MagicMock) -> None:
+        mock_storage.version = 0
+        hybrid_search("validate", mock_storage, query_embedding=[0.1])
+        hybrid_search("validate", mock_storage, query_embedding=[0.2])
+        hybrid_search("validate", mock_storage, query_embedding=[0.1], limit=2)
+
+        assert mock_storage.fts_search.call_count == 3
+
+    def test_version_change_invalidates(self, mock_storage: MagicMock) -> None:
+        mock_storage.version = 0
+        hybrid_search("validate", mock_storage, query_embedding=None)
+        mock_storage.version = 1
+        mock_storage.fts_search.return_value = [SearchResult(node_id="z", score=1.0)]
+
+        results = hybrid_search("validate", mock_storage, query_embedding=None)
+
+        assert [r.node_id for r in results] == ["z"]
+        assert mock_storage.fts_search.call_count == 2
+
+    def test_unversioned_storage_not_cached(self, mock_storage: MagicMock) -> None:
+        hybrid_search("validate", mock_storage, query_embedding=[0.1])
+        hybrid_search("validate", mock_storage, query_embedding=[0.1])
+
+        assert mock_storage.fts_search.call_count == 2
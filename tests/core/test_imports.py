@@ -423,3 +423,25 @@ class TestProcessImportsNoDuplicates:
 
         imports_rels = graph.get_relationships_by_type(RelType.IMPORTS)
         assert len(imports_rels) == 1
+
+    def test_first_import_wins_in_one_batch(self, graph: KnowledgeGraph) -> None:
+        """The first import of a pair sets its symbols; edges land in one batch."""
+        parse_data = [
+            FileParseData(
+                file_path="src/auth/validate.py",
+                language="python",
+                parse_result=ParseResult(
+                    imports=[
+                        ImportInfo(module=".utils", names=["helper"], is_relative=True),
+                        ImportInfo(module=".utils", names=["other"], is_relative=True),
+                    ],
+                ),
+            ),
+        ]
+        version = graph.version
+
+        process_imports(parse_data, graph)
+
+        [rel] = graph.get_relationships_by_type(RelType.IMPORTS)
+        assert rel.properties["symbols"] == "helper"
+        assert graph.version == version + 1
@@ -327,3 +327,30 @@ class TestMultipleLabels:
         assert backend.get_node(cls.id) is not None
         assert backend.get_node(fn.id).label == NodeLabel.FUNCTION
         assert backend.get_node(cls.id).label == NodeLabel.CLASS
+
+
+# ---------------------------------------------------------------------------
+# version
+# ---------------------------------------------------------------------------
+
+
+class TestVersion:
+    def test_writes_bump_version(self, backend: KuzuBackend) -> None:
+        node = _make_node(name="f1", file_path="src/a.py")
+
+        version = backend.version
+        backend.add_nodes([node])
+        assert backend.version > version
+
+        version = backend.version
+        backend.remove_nodes_by_file("src/a.py")
+        assert backend.version > version
+
+    def test_reads_keep_version(self, backend: KuzuBackend) -> None:
+        backend.add_nodes([_make_node(name="f1", file_path="src/a.py")])
+
+        version = backend.version
+        backend.get_node(generate_id(NodeLabel.FUNCTION, "src/a.py", "f1"))
+        backend.fts_search("f1", limit=5)
+        backend.execute_raw("MATCH (n:Function) RETURN n.name")
+        assert backend.version == version
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from axon_pro.core.graph.model import GraphNode, NodeLabel, generate_id
@@ -195,6 +196,23 @@ class TestEmbeddingsAndVectorSearch:
         assert top.score == pytest.approx(1.0, abs=1e-6)
         assert top.node_name == "embed_func"
 
+    @pytest.mark.parametrize("use_csv", [True, False], ids=["csv", "merge"])
+    def test_store_numpy_embedding(
+        self, backend: KuzuBackend, monkeypatch: pytest.MonkeyPatch, use_csv: bool
+    ) -> None:
+        """float32 numpy vectors, as embed_graph returns them, are stored by both paths."""
+        node = _make_node(name="np_func", file_path="src/np.py")
+        backend.add_nodes([node])
+        if not use_csv:
+            monkeypatch.setattr(backend, "_bulk_store_embeddings_csv", lambda _: False)
+
+        vec = np.array([0.0, 1.0, 0.0], dtype=np.float32)
+        backend.store_embeddings([NodeEmbedding(node_id=node.id, embedding=vec)])
+
+        results = backend.vector_search([0.0, 1.0, 0.0], limit=5)
+        assert [r.node_id for r in results] == [node.id]
+        assert results[0].score == pytest.approx(1.0, abs=1e-6)
+
     def test_vector_search_empty(self, backend: KuzuBackend) -> None:
         """When no embeddings exist, vector_search returns an empty list."""
         results = backend.vector_search([1.0, 0.0, 0.0], limit=5)